@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/dace/codegen/tools/dacestub.cpp" "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_build_cache_test_scale.dir/tools/dacestub.cpp.o" "gcc" "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_build_cache_test_scale.dir/tools/dacestub.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_build_cache_test_scale.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_build_cache_test_scale.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_layout_and_schedule_transformations_tests_build_cache_test_scale.pdb"
+  "libdacestub_layout_and_schedule_transformations_tests_build_cache_test_scale.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_layout_and_schedule_transformations_tests_build_cache_test_scale.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_build_cache_test_scale "b3d3bef3fa376f7e01e60ea3c361b0336a9fbf21588299eb85306dfcf2f0d196"
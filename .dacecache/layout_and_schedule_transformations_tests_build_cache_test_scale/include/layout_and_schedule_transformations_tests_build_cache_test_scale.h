@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * layout_and_schedule_transformations_tests_build_cache_test_scaleHandle_t;
+extern "C" layout_and_schedule_transformations_tests_build_cache_test_scaleHandle_t __dace_init_layout_and_schedule_transformations_tests_build_cache_test_scale(int64_t N);
+extern "C" int __dace_exit_layout_and_schedule_transformations_tests_build_cache_test_scale(layout_and_schedule_transformations_tests_build_cache_test_scaleHandle_t handle);
+extern "C" void __program_layout_and_schedule_transformations_tests_build_cache_test_scale(layout_and_schedule_transformations_tests_build_cache_test_scaleHandle_t handle, double * __restrict__ A, double * __restrict__ B, int64_t N);
@@ -0,0 +1,2 @@
+# CMAKE generated file: DO NOT EDIT!
+# Timestamp file for compiler generated dependencies management for dacestub_layout_and_schedule_transformations_tests_build_cache_test_scale_transposed.
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_build_cache_test_scale_transposed.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_build_cache_test_scale_transposed/src/cpu/layout_and_schedule_transformations_tests_build_cache_test_scale_transposed.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_build_cache_test_scale_transposed.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_build_cache_test_scale_transposed/src/cpu/layout_and_schedule_transformations_tests_build_cache_test_scale_transposed.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_build_cache_test_scale_transposed.pdb"
+  "liblayout_and_schedule_transformations_tests_build_cache_test_scale_transposed.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_build_cache_test_scale_transposed.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_build_cache_test_scale_transposed "5187d4631b8abacf3157ef87b45569da7e96dd528b399500101bb49568a2cbce"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_differential_validation_test_kernel.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_differential_validation_test_kernel/src/cpu/layout_and_schedule_transformations_tests_differential_validation_test_kernel.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_differential_validation_test_kernel.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_differential_validation_test_kernel/src/cpu/layout_and_schedule_transformations_tests_differential_validation_test_kernel.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_differential_validation_test_kernel.pdb"
+  "liblayout_and_schedule_transformations_tests_differential_validation_test_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_differential_validation_test_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
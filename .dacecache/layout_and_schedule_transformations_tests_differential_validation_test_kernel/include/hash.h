@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_differential_validation_test_kernel "8d48f7ede742ebfcdf6063345cd30ec6ef6c1ff466da6132263f66563d2f2c28"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed/src/cpu/layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed/src/cpu/layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed.pdb"
+  "liblayout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
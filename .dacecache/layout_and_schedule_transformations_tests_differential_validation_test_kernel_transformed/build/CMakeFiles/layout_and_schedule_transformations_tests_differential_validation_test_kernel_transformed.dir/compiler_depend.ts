@@ -0,0 +1,2 @@
+# CMAKE generated file: DO NOT EDIT!
+# Timestamp file for compiler generated dependencies management for layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed.
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed "cc25ef8725d20f58488a6a7d0fad1dd551f2c9f1529c244cf84f606f0d9c711a"
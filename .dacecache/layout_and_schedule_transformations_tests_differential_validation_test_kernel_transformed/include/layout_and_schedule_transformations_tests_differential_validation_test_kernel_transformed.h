@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformedHandle_t;
+extern "C" layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformedHandle_t __dace_init_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed(int64_t N);
+extern "C" int __dace_exit_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed(layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformedHandle_t handle);
+extern "C" void __program_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed(layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformedHandle_t handle, int64_t * __restrict__ neighbors, double * __restrict__ vals_A, double * __restrict__ vals_B, int64_t N);
@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed.h"
+
+int main(int argc, char **argv) {
+    layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformedHandle_t handle;
+    int err;
+    int64_t N = 42;
+    int64_t * __restrict__ neighbors = (int64_t*) calloc(((4 * N) * N), sizeof(int64_t));
+    double * __restrict__ vals_A = (double*) calloc(((N * N) * N), sizeof(double));
+    double * __restrict__ vals_B = (double*) calloc(((N * N) * N), sizeof(double));
+
+
+    handle = __dace_init_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed(N);
+    __program_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed(handle, neighbors, vals_A, vals_B, N);
+    err = __dace_exit_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed(handle);
+
+    free(neighbors);
+    free(vals_A);
+    free(vals_B);
+
+
+    return err;
+}
@@ -0,0 +1,134 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_state_t {
+
+};
+
+inline void layout_and_schedule_transformations_tests_differential_validation_test_kernel_13_4_0_0_2(layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_state_t *__state, const double&  __tmp_15_12_r, const double&  __tmp_16_14_r, double*  __tmp_17_14_r, const int64_t&  __tmp_17_21_r, const int64_t&  __tmp_17_56_r, double*  __tmp_18_14_r, const int64_t&  __tmp_18_21_r, const int64_t&  __tmp_18_56_r, double&  __tmp_14_8_w, int64_t N, int64_t j) {
+    double __tmp1;
+    int64_t __sym___tmp_17_21_r;
+    int64_t __sym___tmp_17_56_r;
+    int64_t __sym___tmp_18_21_r;
+    int64_t __sym___tmp_18_56_r;
+
+    {
+
+        {
+            double __in1 = __tmp_15_12_r;
+            double __in2 = __tmp_16_14_r;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + __in2);
+            ///////////////////
+
+            __tmp1 = __out;
+        }
+
+    }
+    __sym___tmp_17_21_r = __tmp_17_21_r;
+    __sym___tmp_17_56_r = __tmp_17_56_r;
+    __sym___tmp_18_21_r = __tmp_18_21_r;
+    __sym___tmp_18_56_r = __tmp_18_56_r;
+    {
+        double __tmp3[1]  DACE_ALIGN(64);
+        double __tmp5[1]  DACE_ALIGN(64);
+        double __tmp6[1]  DACE_ALIGN(64);
+
+        {
+            double __in1 = __tmp1;
+            double __in2 = __tmp_17_14_r[((((N * N) * __sym___tmp_17_21_r) + (N * (j + 1))) + __sym___tmp_17_56_r)];
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + __in2);
+            ///////////////////
+
+            __tmp3[0] = __out;
+        }
+        {
+            double __in1 = __tmp3[0];
+            double __in2 = __tmp_18_14_r[((((N * N) * __sym___tmp_18_21_r) + (N * (j + 1))) + __sym___tmp_18_56_r)];
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + __in2);
+            ///////////////////
+
+            __tmp5[0] = __out;
+        }
+        {
+            double __in2 = __tmp5[0];
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (0.5 * __in2);
+            ///////////////////
+
+            __tmp6[0] = __out;
+        }
+        {
+            double __inp = __tmp6[0];
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_14_8)
+            __out = __inp;
+            ///////////////////
+
+            __tmp_14_8_w = __out;
+        }
+
+    }
+}
+
+void __program_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_internal(layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_state_t*__state, int64_t * __restrict__ neighbors, double * __restrict__ vals_A, double * __restrict__ vals_B, int64_t N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < (N - 2); i += 1) {
+                for (auto j = 0; j < (N - 2); j += 1) {
+                    for (auto k = 0; k < (N - 2); k += 1) {
+                        layout_and_schedule_transformations_tests_differential_validation_test_kernel_13_4_0_0_2(__state, vals_A[(((((N * N) * (i + 1)) + (N * (j + 1))) + k) + 1)], vals_A[(((((N * N) * (i + 1)) + (N * j)) + k) + 1)], &vals_A[0], neighbors[((((4 * N) * (i + 1)) + (4 * k)) + 4)], neighbors[((((4 * N) * (i + 1)) + (4 * k)) + 6)], &vals_A[0], neighbors[((((4 * N) * (i + 1)) + (4 * k)) + 5)], neighbors[((((4 * N) * (i + 1)) + (4 * k)) + 7)], vals_B[(((((N * N) * (i + 1)) + (N * (j + 1))) + k) + 1)], N, j);
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed(layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_state_t *__state, int64_t * __restrict__ neighbors, double * __restrict__ vals_A, double * __restrict__ vals_B, int64_t N)
+{
+    __program_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_internal(__state, neighbors, vals_A, vals_B, N);
+}
+
+DACE_EXPORTED layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_state_t *__dace_init_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed(int64_t N)
+{
+    int __result = 0;
+    layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_state_t *__state = new layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed(layout_and_schedule_transformations_tests_differential_validation_test_kernel_transformed_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/.dacecache/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_5df07ecf4cea616e3eb384a9be3511bb/src/cpu/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.cpp" "CMakeFiles/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_5df07ecf4cea616e3eb384a9be3511bb/src/cpu/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.cpp.o" "gcc" "CMakeFiles/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_5df07ecf4cea616e3eb384a9be3511bb/src/cpu/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
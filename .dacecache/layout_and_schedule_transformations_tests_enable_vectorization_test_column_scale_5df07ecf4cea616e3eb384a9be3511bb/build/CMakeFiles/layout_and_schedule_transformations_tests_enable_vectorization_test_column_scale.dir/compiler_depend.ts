@@ -0,0 +1,2 @@
+# CMAKE generated file: DO NOT EDIT!
+# Timestamp file for compiler generated dependencies management for layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.
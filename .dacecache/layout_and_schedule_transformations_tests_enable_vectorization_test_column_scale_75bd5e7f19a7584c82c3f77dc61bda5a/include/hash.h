@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale "5fbf16f46b0dea74bf5d4ba50bdac2789a86cd390ef24b315cf33f83e29df48a"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * layout_and_schedule_transformations_tests_enable_vectorization_test_column_scaleHandle_t;
+extern "C" layout_and_schedule_transformations_tests_enable_vectorization_test_column_scaleHandle_t __dace_init_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale();
+extern "C" int __dace_exit_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale(layout_and_schedule_transformations_tests_enable_vectorization_test_column_scaleHandle_t handle);
+extern "C" void __program_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale(layout_and_schedule_transformations_tests_enable_vectorization_test_column_scaleHandle_t handle, double * __restrict__ A, double * __restrict__ B);
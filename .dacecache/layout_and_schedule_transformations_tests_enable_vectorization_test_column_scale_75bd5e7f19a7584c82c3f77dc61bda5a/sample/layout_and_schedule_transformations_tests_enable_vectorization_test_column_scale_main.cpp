@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.h"
+
+int main(int argc, char **argv) {
+    layout_and_schedule_transformations_tests_enable_vectorization_test_column_scaleHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(1024, sizeof(double));
+    double * __restrict__ B = (double*) calloc(1024, sizeof(double));
+
+
+    handle = __dace_init_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale();
+    __program_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale(handle, A, B);
+    err = __dace_exit_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
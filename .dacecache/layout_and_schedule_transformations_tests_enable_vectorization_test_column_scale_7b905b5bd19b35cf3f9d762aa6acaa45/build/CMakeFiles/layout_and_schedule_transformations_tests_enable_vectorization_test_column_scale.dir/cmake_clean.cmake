@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_7b905b5bd19b35cf3f9d762aa6acaa45/src/cpu/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_7b905b5bd19b35cf3f9d762aa6acaa45/src/cpu/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.pdb"
+  "liblayout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,60 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_state_t {
+
+};
+
+void __program_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_internal(layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_state_t*__state, double * __restrict__ A, double * __restrict__ B)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 32; i += 1) {
+                for (auto j = 0; j < 29; j += 1) {
+                    {
+                        double a = A[(i + (32 * j))];
+                        double b;
+
+                        ///////////////////
+                        // Tasklet code (layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_24)
+                        b = (2.0 * a);
+                        ///////////////////
+
+                        B[(i + (32 * j))] = b;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale(layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_state_t *__state, double * __restrict__ A, double * __restrict__ B)
+{
+    __program_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_internal(__state, A, B);
+}
+
+DACE_EXPORTED layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_state_t *__dace_init_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale()
+{
+    int __result = 0;
+    layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_state_t *__state = new layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale(layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
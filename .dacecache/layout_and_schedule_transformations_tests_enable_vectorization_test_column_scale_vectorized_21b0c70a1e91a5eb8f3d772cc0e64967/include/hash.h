@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized "cd040657fc54d9f2ff82a64bc8da0cc1a4d9308f38ebf908f8cb85151a93f545"
@@ -0,0 +1,164 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized_state_t {
+
+};
+
+void __program_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized_internal(layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized_state_t*__state, double * __restrict__ A, double * __restrict__ B)
+{
+    double *permuted_A;
+    permuted_A = new double DACE_ALIGN(64)[1024];
+    double *permuted_B;
+    permuted_B = new double DACE_ALIGN(64)[1024];
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 32; i0 += 1) {
+                for (auto i1 = 0; i1 < 32; i1 += 1) {
+                    {
+                        double _in1 = A[((32 * i0) + i1)];
+                        double _out1;
+
+                        ///////////////////
+                        // Tasklet code (assign)
+                        _out1 = _in1;
+                        ///////////////////
+
+                        permuted_A[(i0 + (32 * i1))] = _out1;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 32; i0 += 1) {
+                for (auto i1 = 0; i1 < 32; i1 += 1) {
+                    {
+                        double _in1 = B[((32 * i0) + i1)];
+                        double _out1;
+
+                        ///////////////////
+                        // Tasklet code (assign)
+                        _out1 = _in1;
+                        ///////////////////
+
+                        permuted_B[(i0 + (32 * i1))] = _out1;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 32; i += 1) {
+                for (auto j = 0; j < 28; j += 2) {
+                    {
+                        dace::vec<double, 2> a = *(dace::vec<double, 2> *)(&permuted_A[((32 * i) + j)]);
+                        dace::vec<double, 2> b;
+
+                        ///////////////////
+                        // Tasklet code (layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_24)
+                        b = (2.0 * a);
+                        ///////////////////
+
+                        *(dace::vec<double, 2> *)(&permuted_B[((32 * i) + j)]) = b;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 32; i += 1) {
+                for (auto j = 28; j < 29; j += 1) {
+                    {
+                        double a = permuted_A[((32 * i) + j)];
+                        double b;
+
+                        ///////////////////
+                        // Tasklet code (layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_24)
+                        b = (2.0 * a);
+                        ///////////////////
+
+                        permuted_B[((32 * i) + j)] = b;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 32; i0 += 1) {
+                for (auto i1 = 0; i1 < 32; i1 += 1) {
+                    {
+                        double _in1 = permuted_A[((32 * i0) + i1)];
+                        double _out1;
+
+                        ///////////////////
+                        // Tasklet code (assign)
+                        _out1 = _in1;
+                        ///////////////////
+
+                        A[(i0 + (32 * i1))] = _out1;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 32; i0 += 1) {
+                for (auto i1 = 0; i1 < 32; i1 += 1) {
+                    {
+                        double _in1 = permuted_B[((32 * i0) + i1)];
+                        double _out1;
+
+                        ///////////////////
+                        // Tasklet code (assign)
+                        _out1 = _in1;
+                        ///////////////////
+
+                        B[(i0 + (32 * i1))] = _out1;
+                    }
+                }
+            }
+        }
+
+    }
+    delete[] permuted_A;
+    delete[] permuted_B;
+}
+
+DACE_EXPORTED void __program_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized(layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized_state_t *__state, double * __restrict__ A, double * __restrict__ B)
+{
+    __program_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized_internal(__state, A, B);
+}
+
+DACE_EXPORTED layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized_state_t *__dace_init_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized()
+{
+    int __result = 0;
+    layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized_state_t *__state = new layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized(layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
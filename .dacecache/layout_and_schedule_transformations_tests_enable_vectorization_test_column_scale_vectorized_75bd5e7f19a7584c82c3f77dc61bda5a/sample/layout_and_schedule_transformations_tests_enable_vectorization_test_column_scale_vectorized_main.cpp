@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized.h"
+
+int main(int argc, char **argv) {
+    layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorizedHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(1024, sizeof(double));
+    double * __restrict__ B = (double*) calloc(1024, sizeof(double));
+
+
+    handle = __dace_init_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized();
+    __program_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized(handle, A, B);
+    err = __dace_exit_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
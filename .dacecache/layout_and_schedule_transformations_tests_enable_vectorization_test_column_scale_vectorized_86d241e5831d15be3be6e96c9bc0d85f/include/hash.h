@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_enable_vectorization_test_column_scale_vectorized "98f05b28fa105a8f853cedefb2892190f35ec258f5c9ac3e791cad1c05513b48"
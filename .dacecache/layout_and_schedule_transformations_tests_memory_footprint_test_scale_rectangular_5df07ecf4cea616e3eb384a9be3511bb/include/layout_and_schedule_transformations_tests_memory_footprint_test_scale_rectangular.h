@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangularHandle_t;
+extern "C" layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangularHandle_t __dace_init_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular(int64_t M, int64_t N);
+extern "C" int __dace_exit_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular(layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangularHandle_t handle);
+extern "C" void __program_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular(layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangularHandle_t handle, double * __restrict__ A, double * __restrict__ B, int64_t M, int64_t N);
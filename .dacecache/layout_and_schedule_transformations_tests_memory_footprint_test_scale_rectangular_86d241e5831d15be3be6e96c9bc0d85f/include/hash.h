@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular "2e6fc29f411471cb4f4d9fb639358a6dd10e79c8d9768448197e6089e070d5df"
@@ -0,0 +1,60 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_state_t {
+
+};
+
+void __program_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_internal(layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_state_t*__state, double * __restrict__ A, double * __restrict__ B, int64_t M, int64_t N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                for (auto j = 0; j < M; j += 1) {
+                    {
+                        double a = A[((N * j) + i)];
+                        double b;
+
+                        ///////////////////
+                        // Tasklet code (layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_30)
+                        b = (2.0 * a);
+                        ///////////////////
+
+                        B[((N * j) + i)] = b;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular(layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_state_t *__state, double * __restrict__ A, double * __restrict__ B, int64_t M, int64_t N)
+{
+    __program_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_internal(__state, A, B, M, N);
+}
+
+DACE_EXPORTED layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_state_t *__dace_init_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular(int64_t M, int64_t N)
+{
+    int __result = 0;
+    layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_state_t *__state = new layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular(layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
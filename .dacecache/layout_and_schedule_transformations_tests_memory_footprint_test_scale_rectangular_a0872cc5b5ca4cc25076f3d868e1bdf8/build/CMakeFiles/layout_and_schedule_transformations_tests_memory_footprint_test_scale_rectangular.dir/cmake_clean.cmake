@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_a0872cc5b5ca4cc25076f3d868e1bdf8/src/cpu/layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_a0872cc5b5ca4cc25076f3d868e1bdf8/src/cpu/layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular.pdb"
+  "liblayout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
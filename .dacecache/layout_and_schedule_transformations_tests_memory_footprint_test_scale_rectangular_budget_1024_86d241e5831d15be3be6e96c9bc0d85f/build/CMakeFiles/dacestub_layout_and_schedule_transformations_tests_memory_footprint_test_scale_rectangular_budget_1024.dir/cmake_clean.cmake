@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024.pdb"
+  "libdacestub_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
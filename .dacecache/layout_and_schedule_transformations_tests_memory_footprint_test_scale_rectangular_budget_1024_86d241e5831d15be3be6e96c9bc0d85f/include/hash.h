@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024 "c7b47f32d28ab235a6608adeb40f0135217ba1c7046a2112e8e7eff4be9b0f8c"
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024 "172bcc3b7a0d1e1e94f371dee43ba121b44ee5dd861c8183869b99dc60a540d1"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024.h"
+
+int main(int argc, char **argv) {
+    layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024Handle_t handle;
+    int err;
+    int64_t M = 42;
+    int64_t N = 42;
+    double * __restrict__ A = (double*) calloc((M * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc((M * N), sizeof(double));
+
+
+    handle = __dace_init_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024(M, N);
+    __program_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024(handle, A, B, M, N);
+    err = __dace_exit_layout_and_schedule_transformations_tests_memory_footprint_test_scale_rectangular_budget_1024(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
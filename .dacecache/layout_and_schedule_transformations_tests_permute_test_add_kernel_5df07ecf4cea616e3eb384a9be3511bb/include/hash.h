@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel "a323807cc6d101b31827a782c21e65c811b77ab1a6f3af94b2572f8a5cbb3a0f"
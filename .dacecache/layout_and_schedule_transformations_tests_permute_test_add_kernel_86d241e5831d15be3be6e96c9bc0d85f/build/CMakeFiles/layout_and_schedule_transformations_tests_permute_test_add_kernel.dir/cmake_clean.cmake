@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_permute_test_add_kernel.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_permute_test_add_kernel_86d241e5831d15be3be6e96c9bc0d85f/src/cpu/layout_and_schedule_transformations_tests_permute_test_add_kernel.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_permute_test_add_kernel.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_permute_test_add_kernel_86d241e5831d15be3be6e96c9bc0d85f/src/cpu/layout_and_schedule_transformations_tests_permute_test_add_kernel.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_permute_test_add_kernel.pdb"
+  "liblayout_and_schedule_transformations_tests_permute_test_add_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_permute_test_add_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
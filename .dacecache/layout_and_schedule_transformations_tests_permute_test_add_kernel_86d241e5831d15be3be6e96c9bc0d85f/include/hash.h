@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel "eeec9fe584a88520fe8cfa49b33e2a460e7f593cf0ac77aa53e4307f79e07cf6"
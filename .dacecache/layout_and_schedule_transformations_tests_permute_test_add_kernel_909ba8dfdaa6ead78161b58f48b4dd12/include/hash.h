@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel "928a827482ed418cc17b81e1a8cbcd7b62c09a3db8fc329bd0152b0140d19020"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_permute_test_add_kernel.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_permute_test_add_kernel_ca2d05e1c5b3d2b271fb96cf2e7f4cda/src/cpu/layout_and_schedule_transformations_tests_permute_test_add_kernel.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_permute_test_add_kernel.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_permute_test_add_kernel_ca2d05e1c5b3d2b271fb96cf2e7f4cda/src/cpu/layout_and_schedule_transformations_tests_permute_test_add_kernel.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_permute_test_add_kernel.pdb"
+  "liblayout_and_schedule_transformations_tests_permute_test_add_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_permute_test_add_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
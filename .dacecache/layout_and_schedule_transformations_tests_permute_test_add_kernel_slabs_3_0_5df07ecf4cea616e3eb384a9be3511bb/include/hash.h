@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0 "aad1587f22a1d122986db981f65bad8b021e7b088baa030c4e94360ffdab87ee"
@@ -0,0 +1,172 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0_state_t {
+
+};
+
+void __program_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0_internal(layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0_state_t*__state, double * __restrict__ A, double * __restrict__ B, int64_t M, int64_t N)
+{
+    double *permuted_A;
+    permuted_A = new double DACE_ALIGN(64)[(M * N)];
+    double *permuted_B;
+    permuted_B = new double DACE_ALIGN(64)[(M * N)];
+    int64_t slab_permute_in_permuted_A;
+    int64_t slab_permute_in_permuted_B;
+    int64_t slab_permute_out_A;
+    int64_t slab_permute_out_B;
+
+
+    for (slab_permute_in_permuted_A = 0; (slab_permute_in_permuted_A < M); slab_permute_in_permuted_A = (slab_permute_in_permuted_A + 3)) {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto i0 = 0; i0 < N; i0 += 1) {
+                    for (auto i1 = slab_permute_in_permuted_A; i1 < Min(M, (slab_permute_in_permuted_A + 3)); i1 += 1) {
+                        {
+                            double _in1 = A[((M * i0) + i1)];
+                            double _out1;
+
+                            ///////////////////
+                            // Tasklet code (assign)
+                            _out1 = _in1;
+                            ///////////////////
+
+                            permuted_A[((N * i1) + i0)] = _out1;
+                        }
+                    }
+                }
+            }
+
+        }
+
+    }
+    for (slab_permute_in_permuted_B = 0; (slab_permute_in_permuted_B < M); slab_permute_in_permuted_B = (slab_permute_in_permuted_B + 3)) {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto i0 = 0; i0 < N; i0 += 1) {
+                    for (auto i1 = slab_permute_in_permuted_B; i1 < Min(M, (slab_permute_in_permuted_B + 3)); i1 += 1) {
+                        {
+                            double _in1 = B[((M * i0) + i1)];
+                            double _out1;
+
+                            ///////////////////
+                            // Tasklet code (assign)
+                            _out1 = _in1;
+                            ///////////////////
+
+                            permuted_B[((N * i1) + i0)] = _out1;
+                        }
+                    }
+                }
+            }
+
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                for (auto j = 0; j < M; j += 1) {
+                    {
+                        double a = permuted_A[((N * j) + i)];
+                        double b;
+
+                        ///////////////////
+                        // Tasklet code (layout_and_schedule_transformations_tests_permute_test_add_kernel_207)
+                        b = (a + 1.0);
+                        ///////////////////
+
+                        permuted_B[((N * j) + i)] = b;
+                    }
+                }
+            }
+        }
+
+    }
+
+    for (slab_permute_out_A = 0; (slab_permute_out_A < N); slab_permute_out_A = (slab_permute_out_A + 3)) {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto i0 = 0; i0 < M; i0 += 1) {
+                    for (auto i1 = slab_permute_out_A; i1 < Min(N, (slab_permute_out_A + 3)); i1 += 1) {
+                        {
+                            double _in1 = permuted_A[((N * i0) + i1)];
+                            double _out1;
+
+                            ///////////////////
+                            // Tasklet code (assign)
+                            _out1 = _in1;
+                            ///////////////////
+
+                            A[((M * i1) + i0)] = _out1;
+                        }
+                    }
+                }
+            }
+
+        }
+
+    }
+    for (slab_permute_out_B = 0; (slab_permute_out_B < N); slab_permute_out_B = (slab_permute_out_B + 3)) {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto i0 = 0; i0 < M; i0 += 1) {
+                    for (auto i1 = slab_permute_out_B; i1 < Min(N, (slab_permute_out_B + 3)); i1 += 1) {
+                        {
+                            double _in1 = permuted_B[((N * i0) + i1)];
+                            double _out1;
+
+                            ///////////////////
+                            // Tasklet code (assign)
+                            _out1 = _in1;
+                            ///////////////////
+
+                            B[((M * i1) + i0)] = _out1;
+                        }
+                    }
+                }
+            }
+
+        }
+
+    }
+    delete[] permuted_A;
+    delete[] permuted_B;
+}
+
+DACE_EXPORTED void __program_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0(layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0_state_t *__state, double * __restrict__ A, double * __restrict__ B, int64_t M, int64_t N)
+{
+    __program_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0_internal(__state, A, B, M, N);
+}
+
+DACE_EXPORTED layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0_state_t *__dace_init_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0(int64_t M, int64_t N)
+{
+    int __result = 0;
+    layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0_state_t *__state = new layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0(layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0 "a117224bcdcb468473d3c98b2da5c70153c1d06290d51389efeec8a7a082679c"
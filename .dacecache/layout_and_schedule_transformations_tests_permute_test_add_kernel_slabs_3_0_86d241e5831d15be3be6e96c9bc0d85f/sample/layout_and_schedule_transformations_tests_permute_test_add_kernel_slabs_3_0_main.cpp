@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0.h"
+
+int main(int argc, char **argv) {
+    layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0Handle_t handle;
+    int err;
+    int64_t M = 42;
+    int64_t N = 42;
+    double * __restrict__ A = (double*) calloc((M * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc((M * N), sizeof(double));
+
+
+    handle = __dace_init_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0(M, N);
+    __program_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0(handle, A, B, M, N);
+    err = __dace_exit_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0 "acec46bd2fb06746d38a6380dfefaabfceba9e8b80b5e563bf9c9c585b3c7662"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0.pdb"
+  "libdacestub_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
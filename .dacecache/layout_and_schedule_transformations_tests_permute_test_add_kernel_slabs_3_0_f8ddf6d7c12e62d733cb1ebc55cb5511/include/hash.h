@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_0 "f5985dbc2f8f87616c876161421888a53993f2e878994c1d282e346140bd8da8"
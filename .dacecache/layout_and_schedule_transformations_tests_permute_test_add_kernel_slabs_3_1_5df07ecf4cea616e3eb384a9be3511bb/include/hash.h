@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_1 "13d5c05dcab86f6028787386aa8479b0240f278881d2099edace214017e17be0"
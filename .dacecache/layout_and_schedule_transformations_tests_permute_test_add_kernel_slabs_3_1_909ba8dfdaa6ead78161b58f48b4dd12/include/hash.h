@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_1 "deb16b68a19b9a442457d667bc36dd6622866e36e55d8464c8fe114f1e3ccba9"
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_1 "6dbc9a7129a4f3bad82511c71dcf124b9b589de87cf99a12c340933a3ca8417f"
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_3_1 "704c61e06aae368b43fd168251fce79cf466ba3696f34c94c89e3f62d0058c44"
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_None_0 "d72446fc3a7efcd65904b127a6bb54497ba21dbdf82332eb9c8b807ed401c0b1"
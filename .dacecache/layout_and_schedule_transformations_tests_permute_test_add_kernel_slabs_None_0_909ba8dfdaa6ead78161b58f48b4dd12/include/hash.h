@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_None_0 "fa24a5052bd7155b05df500ab15432c2dd5c62a0e98c961c4ecb43371d1501e6"
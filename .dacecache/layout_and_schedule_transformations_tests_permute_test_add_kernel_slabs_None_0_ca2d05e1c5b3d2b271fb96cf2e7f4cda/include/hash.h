@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_None_0 "ab46f254620c89d58b0796271d4b2e7589306ff3198699d70f68b01d17aff73d"
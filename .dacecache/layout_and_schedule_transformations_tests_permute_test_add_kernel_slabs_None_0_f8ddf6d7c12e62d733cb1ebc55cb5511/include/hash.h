@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_add_kernel_slabs_None_0 "b390292b514112df4c58c31691659ae464c1e1e5573d61799c8f35667689f058"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_permute_test_stencil_kernel.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_permute_test_stencil_kernel_5df07ecf4cea616e3eb384a9be3511bb/src/cpu/layout_and_schedule_transformations_tests_permute_test_stencil_kernel.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_permute_test_stencil_kernel.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_permute_test_stencil_kernel_5df07ecf4cea616e3eb384a9be3511bb/src/cpu/layout_and_schedule_transformations_tests_permute_test_stencil_kernel.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_permute_test_stencil_kernel.pdb"
+  "liblayout_and_schedule_transformations_tests_permute_test_stencil_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_permute_test_stencil_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,62 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct layout_and_schedule_transformations_tests_permute_test_stencil_kernel_state_t {
+
+};
+
+void __program_layout_and_schedule_transformations_tests_permute_test_stencil_kernel_internal(layout_and_schedule_transformations_tests_permute_test_stencil_kernel_state_t*__state, double * __restrict__ A, double * __restrict__ B, int64_t N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for schedule(static)
+            for (auto i = 1; i < (N - 1); i += 1) {
+                for (auto j = 0; j < N; j += 1) {
+                    {
+                        double center = A[((N * j) + i)];
+                        double left = A[(((N * j) + i) - 1)];
+                        double right = A[(((N * j) + i) + 1)];
+                        double b;
+
+                        ///////////////////
+                        // Tasklet code (layout_and_schedule_transformations_tests_permute_test_stencil_kernel_165)
+                        b = ((0.5 * center) + (0.25 * (left + right)));
+                        ///////////////////
+
+                        B[((N * i) + j)] = b;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_layout_and_schedule_transformations_tests_permute_test_stencil_kernel(layout_and_schedule_transformations_tests_permute_test_stencil_kernel_state_t *__state, double * __restrict__ A, double * __restrict__ B, int64_t N)
+{
+    __program_layout_and_schedule_transformations_tests_permute_test_stencil_kernel_internal(__state, A, B, N);
+}
+
+DACE_EXPORTED layout_and_schedule_transformations_tests_permute_test_stencil_kernel_state_t *__dace_init_layout_and_schedule_transformations_tests_permute_test_stencil_kernel(int64_t N)
+{
+    int __result = 0;
+    layout_and_schedule_transformations_tests_permute_test_stencil_kernel_state_t *__state = new layout_and_schedule_transformations_tests_permute_test_stencil_kernel_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_layout_and_schedule_transformations_tests_permute_test_stencil_kernel(layout_and_schedule_transformations_tests_permute_test_stencil_kernel_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_stencil_kernel "b0ada72c8be88e0e7665d2736dea5d88345c9788178ac7f722d692fa407b8781"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_permute_test_stencil_kernel.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_permute_test_stencil_kernel.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_layout_and_schedule_transformations_tests_permute_test_stencil_kernel.pdb"
+  "libdacestub_layout_and_schedule_transformations_tests_permute_test_stencil_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_layout_and_schedule_transformations_tests_permute_test_stencil_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo_5df07ecf4cea616e3eb384a9be3511bb/src/cpu/layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo_5df07ecf4cea616e3eb384a9be3511bb/src/cpu/layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo.pdb"
+  "liblayout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo "e4665f214c662f1d269819347426fc7e2a294d237990572f83fee05a1d705e54"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_haloHandle_t;
+extern "C" layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_haloHandle_t __dace_init_layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo(int64_t N);
+extern "C" int __dace_exit_layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo(layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_haloHandle_t handle);
+extern "C" void __program_layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo(layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_haloHandle_t handle, double * __restrict__ A, double * __restrict__ B, int64_t N);
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_stencil_kernel_first_touch_halo "fb5585e8a336ae58396476b27a703ec043220ddea679a78a57dfcd03454dba44"
@@ -0,0 +1,60 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct layout_and_schedule_transformations_tests_permute_test_transpose_kernel_state_t {
+
+};
+
+void __program_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_internal(layout_and_schedule_transformations_tests_permute_test_transpose_kernel_state_t*__state, double * __restrict__ A, double * __restrict__ B, int64_t N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for schedule(static, 2)
+            for (auto i = 0; i < N; i += 1) {
+                for (auto j = 0; j < N; j += 1) {
+                    {
+                        double a = A[((N * j) + i)];
+                        double b;
+
+                        ///////////////////
+                        // Tasklet code (layout_and_schedule_transformations_tests_permute_test_transpose_kernel_122)
+                        b = (2.0 * a);
+                        ///////////////////
+
+                        B[((N * i) + j)] = b;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_layout_and_schedule_transformations_tests_permute_test_transpose_kernel(layout_and_schedule_transformations_tests_permute_test_transpose_kernel_state_t *__state, double * __restrict__ A, double * __restrict__ B, int64_t N)
+{
+    __program_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_internal(__state, A, B, N);
+}
+
+DACE_EXPORTED layout_and_schedule_transformations_tests_permute_test_transpose_kernel_state_t *__dace_init_layout_and_schedule_transformations_tests_permute_test_transpose_kernel(int64_t N)
+{
+    int __result = 0;
+    layout_and_schedule_transformations_tests_permute_test_transpose_kernel_state_t *__state = new layout_and_schedule_transformations_tests_permute_test_transpose_kernel_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_layout_and_schedule_transformations_tests_permute_test_transpose_kernel(layout_and_schedule_transformations_tests_permute_test_transpose_kernel_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_transpose_kernel "5d79abb49017bc8dec3e651db3d54319621ac3ac1f9f257f3f2db2b616bc4a7d"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch.pdb"
+  "libdacestub_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch "109a7bf1e9599ae450ad8794143d417856c085563152c329a2054710e68d034e"
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch "4ccc54ee7d0f45d0cffacab9542161633d0ef0a63fb5c4e3cd4bbb6976287e7a"
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch "3d8192c100df07f82a357a65d12aad4de6eff65f0a0eede1833b0b7db46888ac"
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map "96699147603772db5090200a7e63bfdd34c00bbdefcc38f8ec30acd98b6aa10b"
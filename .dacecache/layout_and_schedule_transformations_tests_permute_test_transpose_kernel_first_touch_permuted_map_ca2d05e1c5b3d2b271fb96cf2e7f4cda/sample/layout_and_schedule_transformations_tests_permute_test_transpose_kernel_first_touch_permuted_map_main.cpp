@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map.h"
+
+int main(int argc, char **argv) {
+    layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_mapHandle_t handle;
+    int err;
+    int64_t N = 42;
+    double * __restrict__ A = (double*) calloc((N * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc((N * N), sizeof(double));
+
+
+    handle = __dace_init_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map(N);
+    __program_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map(handle, A, B, N);
+    err = __dace_exit_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
@@ -0,0 +1,107 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map_state_t {
+
+};
+
+void __program_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map_internal(layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map_state_t*__state, double * __restrict__ A, double * __restrict__ B, int64_t N)
+{
+    double *permuted_A;
+    permuted_A = new double DACE_ALIGN(64)[(N * N)];
+
+    {
+
+        {
+            #pragma omp parallel for schedule(static)
+            for (auto i0 = 0; i0 < N; i0 += 1) {
+                for (auto i1 = 0; i1 < N; i1 += 1) {
+                    {
+                        double _in1 = A[((N * i0) + i1)];
+                        double _out1;
+
+                        ///////////////////
+                        // Tasklet code (assign)
+                        _out1 = _in1;
+                        ///////////////////
+
+                        permuted_A[((N * i1) + i0)] = _out1;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for schedule(static)
+            for (auto j = 0; j < N; j += 1) {
+                for (auto i = 0; i < N; i += 1) {
+                    {
+                        double a = permuted_A[((N * i) + j)];
+                        double b;
+
+                        ///////////////////
+                        // Tasklet code (layout_and_schedule_transformations_tests_permute_test_transpose_kernel_207)
+                        b = (2.0 * a);
+                        ///////////////////
+
+                        B[((N * i) + j)] = b;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < N; i0 += 1) {
+                for (auto i1 = 0; i1 < N; i1 += 1) {
+                    {
+                        double _in1 = permuted_A[((N * i0) + i1)];
+                        double _out1;
+
+                        ///////////////////
+                        // Tasklet code (assign)
+                        _out1 = _in1;
+                        ///////////////////
+
+                        A[((N * i1) + i0)] = _out1;
+                    }
+                }
+            }
+        }
+
+    }
+    delete[] permuted_A;
+}
+
+DACE_EXPORTED void __program_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map(layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map_state_t *__state, double * __restrict__ A, double * __restrict__ B, int64_t N)
+{
+    __program_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map_internal(__state, A, B, N);
+}
+
+DACE_EXPORTED layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map_state_t *__dace_init_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map(int64_t N)
+{
+    int __result = 0;
+    layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map_state_t *__state = new layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map(layout_and_schedule_transformations_tests_permute_test_transpose_kernel_first_touch_permuted_map_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_plan_test_scale_dispatched "e5a45441edcf03b6e67893a4056f062ff0d265807c288b3fc581a73d81192b71"
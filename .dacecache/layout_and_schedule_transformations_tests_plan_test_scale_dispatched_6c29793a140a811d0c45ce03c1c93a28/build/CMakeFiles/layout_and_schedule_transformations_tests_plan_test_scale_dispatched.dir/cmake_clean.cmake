@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_plan_test_scale_dispatched.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_plan_test_scale_dispatched_6c29793a140a811d0c45ce03c1c93a28/src/cpu/layout_and_schedule_transformations_tests_plan_test_scale_dispatched.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_plan_test_scale_dispatched.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_plan_test_scale_dispatched_6c29793a140a811d0c45ce03c1c93a28/src/cpu/layout_and_schedule_transformations_tests_plan_test_scale_dispatched.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_plan_test_scale_dispatched.pdb"
+  "liblayout_and_schedule_transformations_tests_plan_test_scale_dispatched.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_plan_test_scale_dispatched.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
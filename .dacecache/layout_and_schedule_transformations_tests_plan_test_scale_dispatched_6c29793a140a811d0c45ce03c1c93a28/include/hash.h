@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_plan_test_scale_dispatched "6f1e5a0c8614d4b6fd414ae3a876b489ce0ffa3246c9a514b977fe5ff17186cb"
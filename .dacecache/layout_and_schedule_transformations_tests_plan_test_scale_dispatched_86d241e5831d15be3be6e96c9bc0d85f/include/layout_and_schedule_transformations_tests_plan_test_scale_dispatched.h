@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * layout_and_schedule_transformations_tests_plan_test_scale_dispatchedHandle_t;
+extern "C" layout_and_schedule_transformations_tests_plan_test_scale_dispatchedHandle_t __dace_init_layout_and_schedule_transformations_tests_plan_test_scale_dispatched(int64_t N);
+extern "C" int __dace_exit_layout_and_schedule_transformations_tests_plan_test_scale_dispatched(layout_and_schedule_transformations_tests_plan_test_scale_dispatchedHandle_t handle);
+extern "C" void __program_layout_and_schedule_transformations_tests_plan_test_scale_dispatched(layout_and_schedule_transformations_tests_plan_test_scale_dispatchedHandle_t handle, double * __restrict__ A, double * __restrict__ B, int64_t N);
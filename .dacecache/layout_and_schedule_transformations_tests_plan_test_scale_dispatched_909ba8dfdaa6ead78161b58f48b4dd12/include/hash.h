@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_plan_test_scale_dispatched "1e14335754705df682d5e12edbaad8a4d8f839d1bb079b9daaee9d24f6f8739e"
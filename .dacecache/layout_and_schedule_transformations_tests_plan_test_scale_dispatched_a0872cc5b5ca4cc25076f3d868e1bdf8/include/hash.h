@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_plan_test_scale_dispatched "a74411311eca1c73501a7647087ed10c5845a53a1782364beff1d6f18a867b5e"
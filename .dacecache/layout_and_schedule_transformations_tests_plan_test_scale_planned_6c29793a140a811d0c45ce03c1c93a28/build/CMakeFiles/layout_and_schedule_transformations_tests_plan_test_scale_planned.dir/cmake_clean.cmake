@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_plan_test_scale_planned.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_plan_test_scale_planned_6c29793a140a811d0c45ce03c1c93a28/src/cpu/layout_and_schedule_transformations_tests_plan_test_scale_planned.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_plan_test_scale_planned.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_plan_test_scale_planned_6c29793a140a811d0c45ce03c1c93a28/src/cpu/layout_and_schedule_transformations_tests_plan_test_scale_planned.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_plan_test_scale_planned.pdb"
+  "liblayout_and_schedule_transformations_tests_plan_test_scale_planned.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_plan_test_scale_planned.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_5df07ecf4cea616e3eb384a9be3511bb/src/cpu/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_5df07ecf4cea616e3eb384a9be3511bb/src/cpu/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_schedule_map_nests_test_scale.pdb"
+  "liblayout_and_schedule_transformations_tests_schedule_map_nests_test_scale.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
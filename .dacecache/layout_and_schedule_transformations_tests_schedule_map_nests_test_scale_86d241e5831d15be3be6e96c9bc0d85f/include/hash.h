@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale "bd416a520ee76fbe05f4dbcc2303bf797ccb34840a230acef6506cb770bf9737"
@@ -0,0 +1 @@
+#define __HASH_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled "005e43f73e5c37e594e49507596385b038d9a2578d470af18c9608a9744c6e42"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduledHandle_t;
+extern "C" layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduledHandle_t __dace_init_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled(int64_t N);
+extern "C" int __dace_exit_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled(layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduledHandle_t handle);
+extern "C" void __program_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled(layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduledHandle_t handle, double * __restrict__ A, double * __restrict__ B, int64_t N);
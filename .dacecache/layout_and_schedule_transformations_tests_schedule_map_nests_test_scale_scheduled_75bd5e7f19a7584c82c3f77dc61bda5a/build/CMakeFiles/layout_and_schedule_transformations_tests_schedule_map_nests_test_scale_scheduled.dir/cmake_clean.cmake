@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled_75bd5e7f19a7584c82c3f77dc61bda5a/src/cpu/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.cpp.o"
+  "CMakeFiles/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.dir/root/package/.dacecache/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled_75bd5e7f19a7584c82c3f77dc61bda5a/src/cpu/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.cpp.o.d"
+  "liblayout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.pdb"
+  "liblayout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.pdb"
+  "libdacestub_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_layout_and_schedule_transformations_tests_schedule_map_nests_test_scale_scheduled.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
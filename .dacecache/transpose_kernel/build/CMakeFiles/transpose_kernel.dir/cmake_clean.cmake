@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/transpose_kernel.dir/root/package/.dacecache/transpose_kernel/src/cpu/transpose_kernel.cpp.o"
+  "CMakeFiles/transpose_kernel.dir/root/package/.dacecache/transpose_kernel/src/cpu/transpose_kernel.cpp.o.d"
+  "libtranspose_kernel.pdb"
+  "libtranspose_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/transpose_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
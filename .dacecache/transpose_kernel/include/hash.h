@@ -0,0 +1 @@
+#define __HASH_transpose_kernel "555da42d65b684f223ce0fe64ef2d9d9ba3ae8c641b2b8641d32f6447d87f3e3"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * transpose_kernelHandle_t;
+extern "C" transpose_kernelHandle_t __dace_init_transpose_kernel(int64_t N);
+extern "C" int __dace_exit_transpose_kernel(transpose_kernelHandle_t handle);
+extern "C" void __program_transpose_kernel(transpose_kernelHandle_t handle, double * __restrict__ A, double * __restrict__ B, int64_t N);
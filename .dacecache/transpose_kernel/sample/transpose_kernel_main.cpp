@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/transpose_kernel.h"
+
+int main(int argc, char **argv) {
+    transpose_kernelHandle_t handle;
+    int err;
+    int64_t N = 42;
+    double * __restrict__ A = (double*) calloc((N * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc((N * N), sizeof(double));
+
+
+    handle = __dace_init_transpose_kernel(N);
+    __program_transpose_kernel(handle, A, B, N);
+    err = __dace_exit_transpose_kernel(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
@@ -0,0 +1,17 @@
+# The transformations are loaded on first access, importing the package (or the registry and plan modules) does not
+# import dace
+from layout_and_schedule_transformations.registry import REGISTRY
+
+__all__ = sorted(REGISTRY)
+
+
+def __getattr__(name: str):
+    if name in REGISTRY:
+        transformation_class = REGISTRY[name].load()
+        globals()[name] = transformation_class
+        return transformation_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(REGISTRY))
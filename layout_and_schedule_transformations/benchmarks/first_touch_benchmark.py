@@ -0,0 +1,71 @@
+"""
+Compares the NUMA placement of the ``permuted_*`` transients created by ``PermuteArrayDimensions``: with the default
+copy-in map and with a copy-in map partitioned like the consumer map (``first_touch=True``).
+
+The difference is only visible on multi-socket machines with the threads spread over the sockets, e.g.::
+
+    OMP_PROC_BIND=spread OMP_PLACES=cores python first_touch_benchmark.py --size 384
+"""
+import argparse
+import copy
+import time
+import numpy as np
+import dace
+
+from layout_and_schedule_transformations.permute_array_dimensions import PermuteArrayDimensions
+
+N = dace.symbol("N", dtype=dace.int64)
+
+
+@dace.program
+def kernel(A: dace.float64[N, N, N], B: dace.float64[N, N, N]):
+    # Reads A transposed, permuting A with [2, 1, 0] makes the reads contiguous
+    for i, j, k in dace.map[1:N - 1, 0:N, 0:N]:
+        with dace.tasklet:
+            center << A[k, j, i]
+            left << A[k, j, i - 1]
+            right << A[k, j, i + 1]
+            b >> B[i, j, k]
+            b = 0.5 * center + 0.25 * (left + right)
+
+
+def _variant(sdfg: dace.SDFG, first_touch: bool) -> dace.SDFG:
+    variant = copy.deepcopy(sdfg)
+    variant.name = f"{sdfg.name}_{'first_touch' if first_touch else 'default'}"
+    for node, _ in variant.all_nodes_recursive():
+        if isinstance(node, dace.nodes.MapEntry):
+            node.map.schedule = dace.dtypes.ScheduleType.CPU_Multicore
+            node.map.omp_schedule = dace.dtypes.OMPScheduleType.Static
+    PermuteArrayDimensions(permute_map={"A": [2, 1, 0]}, add_permute_maps=True,
+                           first_touch=first_touch).apply_pass(variant, {})
+    variant.validate()
+    return variant
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--repetitions", type=int, default=10)
+    args = parser.parse_args()
+
+    sdfg = kernel.to_sdfg(simplify=True)
+    A = np.random.rand(args.size, args.size, args.size)
+    reference = None
+    for first_touch in (False, True):
+        compiled_sdfg = _variant(sdfg, first_touch).compile()
+        times = []
+        for _ in range(args.repetitions):
+            B = np.zeros_like(A)
+            # Every call allocates the permuted transient, so every call first-touches its pages again
+            start = time.perf_counter()
+            compiled_sdfg(A=A, B=B, N=args.size)
+            times.append(time.perf_counter() - start)
+        if reference is None:
+            reference = B
+        assert np.allclose(reference, B)
+        print(f"{'first touch' if first_touch else 'default':>12}: min {min(times) * 1e3:8.2f} ms, "
+              f"median {np.median(times) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Measures the startup cost of short-lived worker processes: importing the package, parsing and validating a plan, and
+loading a transformation (which imports dace). Every measurement runs in a fresh interpreter.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+_PLAN = ('[{"transformation": "PermuteArrayDimensions", '
+         '"options": {"permute_map": {"A": [1, 0]}, "add_permute_maps": true}}]')
+
+_CASES = {
+    "python": "pass",
+    "import package": "import layout_and_schedule_transformations",
+    "parse and validate plan": ("from layout_and_schedule_transformations.plan import TransformationPlan\n"
+                                f"TransformationPlan.from_json('{_PLAN}').validate()"),
+    "load a transformation": ("import layout_and_schedule_transformations\n"
+                              "layout_and_schedule_transformations.PermuteArrayDimensions"),
+    "import dace": "import dace",
+}
+
+
+def _measure(code: str, repetitions: int) -> float:
+    times = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, code in _CASES.items():
+        print(f"{name:>24}: {_measure(code, args.repetitions) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import dace
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from dace.codegen.compiled_sdfg import CompiledSDFG
+from dace.sdfg import utils as sdutil
+from typing import List, Optional, Tuple
+
+# Configuration sections that change the generated code or the shared library. Whole sections are hashed, such that
+# entries added in later DaCe versions (or missed here) cannot make two different builds share a key. The library
+# section selects the default implementations library nodes are expanded to.
+_CONFIG_SECTIONS = ("compiler", "library")
+
+
+def _instrumentation(sdfg: dace.SDFG) -> str:
+    # hash_sdfg ignores every instrument property, but instrumentation changes the generated code
+    settings = []
+    for nested_sdfg in sdfg.all_sdfgs_recursive():
+        settings.append(f"{nested_sdfg.name}={nested_sdfg.instrument.name}")
+        for state in nested_sdfg.all_states():
+            settings.append(f"{nested_sdfg.name}/{state.label}={state.instrument.name}")
+            for node in state.nodes():
+                instrument = getattr(node, "instrument", None)
+                if instrument is not None and instrument.name != "No_Instrumentation":
+                    settings.append(f"{nested_sdfg.name}/{state.label}/{state.node_id(node)}={instrument.name}")
+    return ";".join(settings)
+
+
+class BuildCache:
+    """
+    Content-addressed cache of compiled SDFGs. Entries are keyed by the canonical hash of the SDFG (which ignores
+    node IDs, transformation history and instrumentation), the instrumentation of the SDFGs, states and nodes,
+    the SDFG name (which the library symbols are derived from), the DaCe version and the compiler and library
+    configuration. The least recently used entries are evicted once the cache
+    grows over ``max_size`` bytes.
+
+    Each entry is a folder with the ``program.sdfg`` and the shared libraries, which is the layout
+    ``dace.sdfg.utils.load_precompiled_sdfg`` expects.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = 4 * 1024**3):
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        if cache_dir is None:
+            cache_dir = os.path.join(dace.Config.get("default_build_folder"), "build_cache")
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, sdfg: dace.SDFG) -> str:
+        hasher = hashlib.sha256()
+        hasher.update(sdfg.hash_sdfg().encode("utf-8"))
+        hasher.update(_instrumentation(sdfg).encode("utf-8"))
+        hasher.update(sdfg.name.encode("utf-8"))
+        hasher.update(dace.__version__.encode("utf-8"))
+        for section in _CONFIG_SECTIONS:
+            try:
+                value = dace.Config.get(section)
+            except KeyError:
+                value = None
+            hasher.update(f"{section}={json.dumps(value, sort_keys=True, default=str)};".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def compile(self, sdfg: dace.SDFG, validate: bool = True) -> CompiledSDFG:
+        """ Returns the cached build of the SDFG if there is one, otherwise compiles and caches it. """
+        key = self.key(sdfg)
+        compiled_sdfg = self._load(key)
+        if compiled_sdfg is not None:
+            self.hits += 1
+            return compiled_sdfg
+
+        self.misses += 1
+        compiled_sdfg = sdfg.compile(validate=validate)
+        self._store(key, sdfg)
+        self.evict(keep=key)
+        return compiled_sdfg
+
+    def contains(self, sdfg: dace.SDFG) -> bool:
+        return os.path.isdir(self._entry_path(self.key(sdfg)))
+
+    def size(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """ Removes the least recently used entries until the cache fits in ``max_size`` bytes. """
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total_size = sum(size for _, _, size in entries)
+        for key, _, size in entries:
+            if total_size <= self.max_size:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self._entry_path(key), ignore_errors=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            path = self._entry_path(key)
+            if key.startswith(".") or not os.path.isdir(path):
+                continue
+            size = 0
+            for root, _, files in os.walk(path):
+                size += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+            entries.append((key, os.path.getmtime(path), size))
+        return entries
+
+    def _load(self, key: str) -> Optional[CompiledSDFG]:
+        path = self._entry_path(key)
+        if not os.path.isdir(path):
+            return None
+        # Mark as recently used
+        os.utime(path)
+        return sdutil.load_precompiled_sdfg(path)
+
+    def _store(self, key: str, sdfg: dace.SDFG) -> None:
+        # The program library and the stub library used to load it
+        extension = dace.Config.get("compiler", "library_extension")
+        library_names = [f"lib{sdfg.name}.{extension}", f"libdacestub_{sdfg.name}.{extension}"]
+
+        # Copy into a temporary folder first, so that concurrent processes never see partial entries
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = os.path.join(self.cache_dir, f".tmp-{key}-{uuid.uuid4().hex}")
+        os.makedirs(os.path.join(tmp_path, "build"))
+        shutil.copy2(os.path.join(sdfg.build_folder, "program.sdfg"), tmp_path)
+        for library_name in library_names:
+            shutil.copy2(os.path.join(sdfg.build_folder, "build", library_name), os.path.join(tmp_path, "build"))
+        try:
+            os.rename(tmp_path, self._entry_path(key))
+        except OSError:
+            # Another process stored the same entry in the meantime
+            shutil.rmtree(tmp_path, ignore_errors=True)
@@ -0,0 +1,276 @@
+import dace
+import itertools
+import math
+from collections import OrderedDict, defaultdict
+from dace.sdfg import utils as sdutil
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class CacheLevel:
+    name: str
+    size: int
+    line_size: int = 64
+    associativity: int = 8
+
+    @property
+    def num_sets(self) -> int:
+        return max(1, self.size // (self.line_size * self.associativity))
+
+
+DEFAULT_CACHE_LEVELS = (
+    CacheLevel("L1", 32 * 1024, 64, 8),
+    CacheLevel("L2", 1024 * 1024, 64, 16),
+    CacheLevel("L3", 32 * 1024 * 1024, 64, 16),
+)
+
+
+class CacheHierarchy:
+    """
+    Set-associative, LRU, write-allocate multi-level cache model. A miss in one level is looked up in the next one and
+    the line is filled into every level it missed in (non-inclusive, non-exclusive).
+    """
+
+    def __init__(self, levels: Sequence[CacheLevel] = DEFAULT_CACHE_LEVELS):
+        for level in levels:
+            if level.size <= 0 or level.line_size <= 0 or level.associativity <= 0:
+                raise ValueError(f"Invalid cache level configuration {level}")
+        self.levels = list(levels)
+        self._sets = [[OrderedDict() for _ in range(level.num_sets)] for level in self.levels]
+
+    def access(self, address: int) -> int:
+        """
+        Simulates one access and returns the index of the level that served it, ``len(levels)`` for main memory.
+        """
+        for i, level in enumerate(self.levels):
+            line = address // level.line_size
+            cache_set = self._sets[i][line % level.num_sets]
+            if line in cache_set:
+                cache_set.move_to_end(line)
+                return i
+            if len(cache_set) >= level.associativity:
+                cache_set.popitem(last=False)
+            cache_set[line] = None
+        return len(self.levels)
+
+
+@dataclass
+class CacheSimulationResult:
+    levels: List[str]
+    array_accesses: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    map_accesses: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    # level name -> array name / map label -> number of misses
+    array_misses: Dict[str, Dict[str, int]] = field(default_factory=lambda: defaultdict(lambda: defaultdict(int)))
+    map_misses: Dict[str, Dict[str, int]] = field(default_factory=lambda: defaultdict(lambda: defaultdict(int)))
+    # Accesses whose address depends on data (e.g. ``A[neighbors[i]]``), included in ``array_accesses`` but
+    # simulated at a representative address, see ``simulate_cache``
+    indirect_accesses: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def total_misses(self, level: Optional[str] = None) -> int:
+        # Defaults to the last level, i.e., the accesses that go to main memory
+        level = self.levels[-1] if level is None else level
+        return sum(self.array_misses[level].values())
+
+    def total_accesses(self) -> int:
+        return sum(self.array_accesses.values())
+
+    def miss_rate(self, level: Optional[str] = None) -> float:
+        accesses = self.total_accesses()
+        return self.total_misses(level) / accesses if accesses else 0.0
+
+
+_EVAL_NAMESPACE = {
+    "Min": min,
+    "Max": max,
+    "min": min,
+    "max": max,
+    "Abs": abs,
+    "Mod": lambda a, b: a % b,
+    "int_floor": lambda a, b: a // b,
+    "int_ceil": lambda a, b: -(-a // b),
+    "floor": math.floor,
+    "ceiling": math.ceil,
+}
+
+
+def _compile_expr(expr) -> Callable[[Dict[str, int]], int]:
+    code = compile(str(dace.symbolic.pystr_to_symbolic(expr)), "<memlet>", "eval")
+    return lambda env: int(eval(code, _EVAL_NAMESPACE, env))
+
+
+def _compile_subset(subset: dace.subsets.Range) -> List[Tuple[Callable, Callable, Callable]]:
+    return [(_compile_expr(b), _compile_expr(e), _compile_expr(s)) for b, e, s in subset.ndrange()]
+
+
+class _ArrayLayout:
+    # Linearizes indices of the original array shape into byte addresses of the candidate layout
+
+    def __init__(self, desc: dace.data.Data, base: int, symbols: Dict[str, int], permute_indices: Optional[List[int]]):
+        self.base = base
+        self.itemsize = desc.dtype.bytes
+        shape = [int(dace.symbolic.evaluate(s, symbols)) for s in desc.shape]
+        if permute_indices is None:
+            self.order = list(range(len(shape)))
+            self.strides = [int(dace.symbolic.evaluate(s, symbols)) for s in desc.strides]
+        else:
+            if sorted(permute_indices) != list(range(len(shape))):
+                raise ValueError(f"Permute indices {permute_indices} are not a permutation of the array dimensions")
+            # Permuted arrays are packed, same as in PermuteArrayDimensions
+            self.order = list(permute_indices)
+            permuted_shape = [shape[i] for i in self.order]
+            self.strides = [1] * len(shape)
+            for i in range(len(shape) - 2, -1, -1):
+                self.strides[i] = self.strides[i + 1] * permuted_shape[i + 1]
+        self.total_size = max(1, sum((shape[i] - 1) * abs(self.strides[j])
+                                     for j, i in enumerate(self.order)) + 1) * self.itemsize
+
+    def address(self, index: Sequence[int]) -> int:
+        return self.base + sum(index[i] * self.strides[j] for j, i in enumerate(self.order)) * self.itemsize
+
+
+class _AddressStreamer:
+
+    def __init__(self,
+                 sdfg: dace.SDFG,
+                 symbols: Dict[str, int],
+                 permute_map: Dict[str, List[int]],
+                 map_permute_map: Dict[str, List[int]],
+                 sample_every: int,
+                 page_size: int = 4096):
+        self._sdfg = sdfg
+        self._symbols = dict(symbols)
+        self._map_permute_map = map_permute_map
+        self._sample_every = sample_every
+        self._subsets = dict()
+        self._volumes = dict()
+        self._map_ranges = dict()
+
+        # Place arrays back to back on page boundaries, in a deterministic order
+        self._layouts = dict()
+        base = page_size
+        for name in sorted(sdfg.arrays):
+            desc = sdfg.arrays[name]
+            if not isinstance(desc, (dace.data.Array, dace.data.Scalar)):
+                continue
+            # Transient scalars and register arrays do not generate memory traffic
+            if desc.storage == dace.dtypes.StorageType.Register or (desc.transient and
+                                                                     isinstance(desc, dace.data.Scalar)):
+                continue
+            layout = _ArrayLayout(desc, base, self._symbols, permute_map.get(name))
+            self._layouts[name] = layout
+            base += (layout.total_size + page_size - 1) // page_size * page_size + page_size
+
+    def stream(self) -> Iterator[Tuple[str, str, int, bool]]:
+        """
+        Yields (map label, array name, address, indirect) for every memlet access of every top-level map, where
+        indirect accesses are those at a representative address.
+        """
+        for state in self._sdfg.all_states():
+            topological_order = {n: i for i, n in enumerate(sdutil.dfs_topological_sort(state))}
+            scope_children = state.scope_children()
+            for node in sorted(scope_children[None], key=lambda n: topological_order[n]):
+                if isinstance(node, dace.nodes.MapEntry):
+                    yield from self._walk_scope(state, node, node.map.label, self._symbols, scope_children,
+                                                topological_order, outermost=True)
+
+    def _iteration_space(self, map_entry: dace.nodes.MapEntry, env: Dict[str, int]) -> Tuple[List[str], List[range]]:
+        if map_entry not in self._map_ranges:
+            self._map_ranges[map_entry] = _compile_subset(map_entry.map.range)
+        ranges = [range(b(env), e(env) + 1, s(env)) for b, e, s in self._map_ranges[map_entry]]
+        params = list(map_entry.map.params)
+
+        # Same semantics as PermuteMapDimensions: new_params[j] = old_params[permute_indices[j]]
+        permute_indices = self._map_permute_map.get(map_entry.map.label)
+        if permute_indices is not None:
+            if sorted(permute_indices) != list(range(len(params))):
+                raise ValueError(f"Permute indices {permute_indices} are not a permutation of the parameters "
+                                 f"of map {map_entry.map.label}")
+            params = [params[i] for i in permute_indices]
+            ranges = [ranges[i] for i in permute_indices]
+        return params, ranges
+
+    def _walk_scope(self, state: dace.SDFGState, map_entry: dace.nodes.MapEntry, label: str, env: Dict[str, int],
+                    scope_children, topological_order, outermost: bool) -> Iterator[Tuple[str, str, int, bool]]:
+        params, ranges = self._iteration_space(map_entry, env)
+        if outermost and ranges:
+            # Only the outermost dimension is sampled, the inner ones are walked fully to keep their spatial locality
+            ranges[0] = ranges[0][::self._sample_every]
+        children = sorted(scope_children[map_entry], key=lambda n: topological_order[n])
+        for point in itertools.product(*ranges):
+            inner_env = dict(env)
+            inner_env.update(zip(params, point))
+            for child in children:
+                if isinstance(child, dace.nodes.MapEntry):
+                    yield from self._walk_scope(state, child, label, inner_env, scope_children, topological_order,
+                                                outermost=False)
+                elif isinstance(child, (dace.nodes.Tasklet, dace.nodes.NestedSDFG)):
+                    # Nested SDFGs are treated as a single access to the subsets of their outer memlets
+                    for edge in itertools.chain(state.in_edges(child), state.out_edges(child)):
+                        yield from self._memlet_accesses(label, edge.data, inner_env)
+
+    def _memlet_accesses(self, label: str, memlet: dace.Memlet,
+                         env: Dict[str, int]) -> Iterator[Tuple[str, str, int, bool]]:
+        if memlet is None or memlet.data is None or memlet.data not in self._layouts:
+            return
+        if id(memlet) not in self._subsets:
+            self._subsets[id(memlet)] = (memlet, _compile_subset(memlet.subset))
+            self._volumes[id(memlet)] = _compile_expr(memlet.volume)
+        _, subset = self._subsets[id(memlet)]
+        layout = self._layouts[memlet.data]
+        ranges = [range(b(env), e(env) + 1, s(env)) for b, e, s in subset]
+
+        # Dynamic and indirect memlets (e.g. ``A[neighbors[i]]``) carry the whole range they might access, but only
+        # access ``volume`` elements of it at addresses unknown before running the SDFG
+        volume = self._volumes[id(memlet)](env)
+        if memlet.dynamic or volume < math.prod(len(r) for r in ranges):
+            if all(len(r) > 0 for r in ranges):
+                address = layout.address([r[0] for r in ranges])
+                for _ in range(max(1, volume)):
+                    yield label, memlet.data, address, True
+            return
+
+        for index in itertools.product(*ranges):
+            yield label, memlet.data, layout.address(index), False
+
+
+def simulate_cache(sdfg: dace.SDFG,
+                   symbols: Dict[str, int],
+                   levels: Sequence[CacheLevel] = DEFAULT_CACHE_LEVELS,
+                   permute_map: Optional[Dict[str, List[int]]] = None,
+                   map_permute_map: Optional[Dict[str, List[int]]] = None,
+                   sample_every: int = 1) -> CacheSimulationResult:
+    """
+    Replays the address stream of the top-level maps of an SDFG through a cache model, without compiling or running
+    the SDFG. Candidate layouts are described with the same plans as ``PermuteArrayDimensions`` (``permute_map``)
+    and ``PermuteMapDimensions`` with labels (``map_permute_map``), and are evaluated on the untransformed SDFG.
+
+    Every state is replayed once, in the order of ``sdfg.all_states()``, sharing one cache across all maps so that
+    reuse between maps is accounted for. Loop trip counts are not taken into account. Data-dependent (indirect or
+    dynamic) accesses are counted ``volume`` times at the first address of their memlet subset and reported in
+    ``indirect_accesses``; their misses are not representative.
+
+    :param sdfg: The SDFG to simulate.
+    :param symbols: Values for all free symbols of the array shapes and map ranges.
+    :param levels: Cache levels, ordered from the closest to the farthest from the core.
+    :param permute_map: Array name to dimension permutation of the candidate layout.
+    :param map_permute_map: Map label to parameter permutation of the candidate schedule.
+    :param sample_every: Only simulate every n-th iteration of the outermost dimension of each top-level map.
+    :return: Accesses and misses per level, per array and per map label.
+    """
+    if sample_every < 1:
+        raise ValueError(f"sample_every must be positive, got {sample_every}")
+
+    cache = CacheHierarchy(levels)
+    result = CacheSimulationResult(levels=[level.name for level in levels])
+    streamer = _AddressStreamer(sdfg, symbols, permute_map or dict(), map_permute_map or dict(), sample_every)
+    for label, array_name, address, indirect in streamer.stream():
+        result.array_accesses[array_name] += 1
+        if indirect:
+            result.indirect_accesses[array_name] += 1
+        result.map_accesses[label] += 1
+        served_by = cache.access(address)
+        for level in result.levels[:served_by]:
+            result.array_misses[level][array_name] += 1
+            result.map_misses[level][label] += 1
+    return result
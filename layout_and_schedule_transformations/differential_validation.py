@@ -0,0 +1,210 @@
+import copy
+import multiprocessing
+import time
+import numpy as np
+import dace
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from dace.transformation import pass_pipeline as ppl
+from layout_and_schedule_transformations.build_cache import BuildCache
+from layout_and_schedule_transformations.plan import TransformationPlan
+
+PlanStep = Union[ppl.Pass, Callable[[dace.SDFG], Any]]
+
+# (shared memory name, shape, NumPy dtype string)
+_BufferSpec = Tuple[str, Tuple[int, ...], str]
+
+
+@dataclass
+class DifferentialValidationResult:
+    # Array name -> maximum absolute difference between the original and transformed outputs
+    max_abs_error: Dict[str, float] = field(default_factory=dict)
+    # Arrays whose outputs are not within the tolerances
+    mismatched: List[str] = field(default_factory=list)
+    # Fastest run of each variant, in seconds
+    original_time: float = 0.0
+    transformed_time: float = 0.0
+
+    @property
+    def speedup(self) -> float:
+        return self.original_time / self.transformed_time if self.transformed_time > 0 else float("inf")
+
+    @property
+    def passed(self) -> bool:
+        return len(self.mismatched) == 0
+
+
+def apply_plan(sdfg: dace.SDFG, plan: Union[TransformationPlan, Sequence[PlanStep]]) -> Dict[str, Any]:
+    """
+    Applies a transformation plan in order. Passes get the results of the previous passes, other steps are called
+    with the SDFG. A ``TransformationPlan`` is applied as is.
+    """
+    if isinstance(plan, TransformationPlan):
+        return plan.apply(sdfg)
+    pipeline_results = dict()
+    for step in plan:
+        if isinstance(step, ppl.Pass):
+            pipeline_results[type(step).__name__] = step.apply_pass(sdfg, pipeline_results)
+        else:
+            step(sdfg)
+    return pipeline_results
+
+
+def generate_inputs(sdfg: dace.SDFG,
+                    symbols: Dict[str, int],
+                    index_ranges: Optional[Dict[str, Tuple[int, int]]] = None,
+                    arguments: Optional[Dict[str, Any]] = None,
+                    seed: int = 42) -> Dict[str, Any]:
+    """
+    Generates random arguments for every non-symbol argument of an SDFG from its data descriptors.
+
+    Integer data is often used for indirect accesses (e.g. a ``neighbors`` array), so its values are drawn from
+    ``index_ranges[name] = (low, high)`` (``high`` exclusive) if given, otherwise from ``[0, smallest extent of any
+    array)``, which is a valid index into every dimension.
+
+    :param arguments: Values to use as-is instead of generating them.
+    """
+    index_ranges = index_ranges or dict()
+    arguments = arguments or dict()
+    rng = np.random.default_rng(seed)
+
+    shapes = dict()
+    for name, desc in sdfg.arglist().items():
+        if isinstance(desc, dace.data.Array):
+            shapes[name] = tuple(int(dace.symbolic.evaluate(s, symbols)) for s in desc.shape)
+    extents = [extent for shape in shapes.values() for extent in shape]
+    default_index_range = (0, max(1, min(extents, default=1)))
+
+    inputs = dict()
+    for name, desc in sdfg.arglist().items():
+        if name in arguments:
+            inputs[name] = arguments[name]
+            continue
+        shape = shapes.get(name, ())
+        dtype = desc.dtype.as_numpy_dtype()
+        if np.issubdtype(dtype, np.bool_):
+            values = rng.integers(0, 2, size=shape).astype(dtype)
+        elif np.issubdtype(dtype, np.integer):
+            low, high = index_ranges.get(name, default_index_range)
+            values = rng.integers(low, high, size=shape).astype(dtype)
+        elif np.issubdtype(dtype, np.complexfloating):
+            values = (rng.random(size=shape) + 1j * rng.random(size=shape)).astype(dtype)
+        else:
+            values = rng.random(size=shape).astype(dtype)
+        inputs[name] = values if isinstance(desc, dace.data.Array) else values.item()
+    return inputs
+
+
+def _run_variant(sdfg_json: Dict[str, Any], inputs: Dict[str, _BufferSpec], outputs: Dict[str, _BufferSpec],
+                 scalars: Dict[str, Any], repetitions: int, build_cache: Optional[BuildCache]) -> float:
+    # Runs in a worker process: compiles the SDFG and runs it on private copies of the shared inputs
+    sdfg = dace.SDFG.from_json(sdfg_json)
+    compiled_sdfg = build_cache.compile(sdfg) if build_cache is not None else sdfg.compile()
+
+    input_buffers = {name: shared_memory.SharedMemory(name=spec[0]) for name, spec in inputs.items()}
+    output_buffers = {name: shared_memory.SharedMemory(name=spec[0]) for name, spec in outputs.items()}
+    try:
+        shared_inputs = {
+            name: np.ndarray(spec[1], dtype=spec[2], buffer=input_buffers[name].buf)
+            for name, spec in inputs.items()
+        }
+        best_time = float("inf")
+        for _ in range(repetitions):
+            # The SDFG may write to its arguments, start every repetition from the same inputs
+            arguments = {name: array.copy() for name, array in shared_inputs.items()}
+            start = time.perf_counter()
+            compiled_sdfg(**arguments, **scalars)
+            best_time = min(best_time, time.perf_counter() - start)
+
+        for name, spec in outputs.items():
+            np.ndarray(spec[1], dtype=spec[2], buffer=output_buffers[name].buf)[...] = arguments[name]
+        return best_time
+    finally:
+        for buffer in list(input_buffers.values()) + list(output_buffers.values()):
+            buffer.close()
+
+
+def _shared_array(like: np.ndarray, buffers: List[shared_memory.SharedMemory]) -> Tuple[np.ndarray, _BufferSpec]:
+    buffer = shared_memory.SharedMemory(create=True, size=max(1, like.nbytes))
+    buffers.append(buffer)
+    array = np.ndarray(like.shape, dtype=like.dtype, buffer=buffer.buf)
+    return array, (buffer.name, like.shape, like.dtype.str)
+
+
+def validate_transformation(sdfg: dace.SDFG,
+                            plan: Union[TransformationPlan, Sequence[PlanStep]],
+                            symbols: Dict[str, int],
+                            index_ranges: Optional[Dict[str, Tuple[int, int]]] = None,
+                            arguments: Optional[Dict[str, Any]] = None,
+                            rtol: float = 1e-10,
+                            atol: float = 1e-12,
+                            repetitions: int = 1,
+                            parallel: bool = True,
+                            build_cache: Optional[BuildCache] = None,
+                            seed: int = 42) -> DifferentialValidationResult:
+    """
+    Applies a transformation plan to a copy of an SDFG, runs the original and the transformed SDFG on the same
+    generated inputs and compares all their non-transient arrays.
+
+    The inputs are generated once (see ``generate_inputs``) and shared with the workers through shared memory. Both
+    variants are compiled and run in separate worker processes, concurrently if ``parallel`` is set (which is faster,
+    but the variants then compete for the machine while being timed).
+
+    :param plan: Passes and callables that transform the SDFG, see ``apply_plan``.
+    :param symbols: Values of the free symbols of the SDFG.
+    :param repetitions: Number of timed runs per variant, the fastest one is reported.
+    :param build_cache: Optional cache to reuse the builds of variants that were compiled before.
+    :return: Per-array maximum error, mismatching arrays and the runtimes of both variants.
+    """
+    original_sdfg = copy.deepcopy(sdfg)
+    transformed_sdfg = copy.deepcopy(sdfg)
+    transformed_sdfg.name = sdfg.name + "_transformed"
+    apply_plan(transformed_sdfg, plan)
+    transformed_sdfg.validate()
+
+    arglist = original_sdfg.arglist()
+    inputs = generate_inputs(original_sdfg, symbols, index_ranges=index_ranges, arguments=arguments, seed=seed)
+    array_inputs = {name: np.ascontiguousarray(value) for name, value in inputs.items() if name in arglist
+                    and isinstance(arglist[name], dace.data.Array)}
+    scalars = {name: value for name, value in inputs.items() if name not in array_inputs}
+    scalars.update(symbols)
+
+    buffers = []
+    try:
+        input_specs = dict()
+        for name, value in array_inputs.items():
+            shared, input_specs[name] = _shared_array(value, buffers)
+            shared[...] = value
+
+        outputs = dict()
+        output_specs = dict()
+        for variant in ("original", "transformed"):
+            outputs[variant] = dict()
+            output_specs[variant] = dict()
+            for name, value in array_inputs.items():
+                outputs[variant][name], output_specs[variant][name] = _shared_array(value, buffers)
+
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2 if parallel else 1, mp_context=mp_context) as executor:
+            futures = {
+                variant: executor.submit(_run_variant, variant_sdfg.to_json(), input_specs, output_specs[variant],
+                                         scalars, repetitions, build_cache)
+                for variant, variant_sdfg in (("original", original_sdfg), ("transformed", transformed_sdfg))
+            }
+            result = DifferentialValidationResult(original_time=futures["original"].result(),
+                                                  transformed_time=futures["transformed"].result())
+
+        for name in array_inputs:
+            original = outputs["original"][name]
+            transformed = outputs["transformed"][name]
+            difference = np.abs(original.astype(np.float64) - transformed.astype(np.float64)) if original.size else 0
+            result.max_abs_error[name] = float(np.max(difference)) if original.size else 0.0
+            if not np.allclose(original, transformed, rtol=rtol, atol=atol, equal_nan=True):
+                result.mismatched.append(name)
+        return result
+    finally:
+        for buffer in buffers:
+            buffer.close()
+            buffer.unlink()
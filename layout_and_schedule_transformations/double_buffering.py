@@ -3,6 +3,9 @@ from dace.properties import make_properties
 from dace.sdfg import utils as sdutil
 from dace.sdfg.state import ControlFlowRegion
 from dace.transformation import transformation
+from layout_and_schedule_transformations.kernel_analysis import (KernelScope, KernelScopeAnalysis,
+                                                                 invalidate_kernel_scopes, kernel_scope)
+from layout_and_schedule_transformations.memory_footprint import data_bytes
 import typing
 
 @transformation.explicit_cf_compatible
@@ -24,17 +27,37 @@ class DoubleBuffering(transformation.SingleStateTransformation):
         desc="The storage type for the destination of the double buffering copy.",
         allow_none=True,
     )
+    memory_budget = dace.properties.Property(
+        dtype=int,
+        default=None,
+        desc="Maximum bytes of copy_dst_type storage a kernel may use once its staged buffers are doubled.",
+        allow_none=True,
+    )
+    budget_symbols = dace.properties.DictProperty(
+        key_type=str,
+        value_type=int,
+        desc="Symbol values used to evaluate the buffer sizes against the memory budget.",
+    )
     map_entry = transformation.PatternNode(dace.nodes.MapEntry)
 
     def __init__(self,
                  device_map_type: dace.dtypes.ScheduleType = None,
                  copy_src_type: dace.dtypes.StorageType = None,
                  copy_dst_type: dace.dtypes.StorageType = None,
+                 memory_budget: typing.Optional[int] = None,
+                 budget_symbols: typing.Optional[typing.Dict[str, int]] = None,
                  **kwargs: typing.Any) -> None:
         super().__init__(**kwargs)
         self.device_map_type = device_map_type
         self.copy_src_type = copy_src_type
         self.copy_dst_type = copy_dst_type
+        self.memory_budget = memory_budget
+        self.budget_symbols = budget_symbols or dict()
+
+    def depends_on(self):
+        # In a pipeline, the analysis is re-run (refreshing the scopes kernel_scope returns) when a pass modifies nodes,
+        # memlets or descriptors
+        return {KernelScopeAnalysis}
 
     @staticmethod
     def annotates_memlets():
@@ -72,21 +95,28 @@ class DoubleBuffering(transformation.SingleStateTransformation):
             return False
 
         # At least one copy from src to dst within the kernel
-        kernel_nodes = graph.all_nodes_between(self.map_entry, graph.exit_node(self.map_entry))
-        kernel_edges = graph.all_edges(*kernel_nodes)
-        has_src_to_dst_copy = False
-        for edge in kernel_edges:
-            if isinstance(edge.src, dace.nodes.AccessNode) and isinstance(edge.dst, dace.nodes.AccessNode):
-                src_arr = sdfg.arrays[edge.src.data]
-                dst_arr = sdfg.arrays[edge.dst.data]
-                if (src_arr.storage == self.copy_src_type and
-                    dst_arr.storage == self.copy_dst_type):
-                    has_src_to_dst_copy = True
-                    break
+        kernel = kernel_scope(graph, self.map_entry)
+        has_src_to_dst_copy = len(kernel.staged_copies.get((self.copy_src_type, self.copy_dst_type), [])) > 0
         if not has_src_to_dst_copy:
             return False
 
+        # The staged buffers are doubled, refuse kernels that would not fit into the budget anymore
+        if self.memory_budget is not None and self._buffer_bytes(graph, kernel) > self.memory_budget:
+            return False
+
         return True
 
+    def _buffer_bytes(self, state: dace.SDFGState, kernel: KernelScope) -> int:
+        arrays = state.sdfg.arrays
+        staged = {e.dst.data for e in kernel.staged_copies.get((self.copy_src_type, self.copy_dst_type), [])}
+        buffers = {
+            n.data for n in kernel.nodes
+            if isinstance(n, dace.nodes.AccessNode) and arrays[n.data].transient
+            and arrays[n.data].storage == self.copy_dst_type
+        }
+        return sum((2 if name in staged else 1) * data_bytes(arrays[name], self.budget_symbols) for name in buffers)
+
     def apply(self, graph: ControlFlowRegion, sdfg: dace.SDFG):
-        return
+        # The transformation does not change the SDFG yet, so there are no statistics to report. The next match
+        # analyzes the kernels anew.
+        invalidate_kernel_scopes(sdfg)
@@ -0,0 +1,172 @@
+import dace
+from typing import Dict, List, Any, Optional, Set
+from dace.transformation.dataflow.vectorization import Vectorization
+from dace.transformation import pass_pipeline as ppl
+from dataclasses import dataclass, field
+
+
+@dataclass
+class VectorizationReport:
+    # Maps are identified by map_id (in the SDFG before vectorization), as labels repeat (e.g. every copy map of
+    # PermuteArrayDimensions)
+    # Innermost maps that were (or, if not applied, could be) vectorized
+    vectorized: List[str] = field(default_factory=list)
+    # Every innermost map that cannot be vectorized -> reason
+    rejected: Dict[str, str] = field(default_factory=dict)
+    # Map id -> map label, for every map in the report
+    labels: Dict[str, str] = field(default_factory=dict)
+
+
+def map_id(state: dace.SDFGState, map_entry: dace.nodes.MapEntry) -> str:
+    """ Identifies a map by its state label and node id, prefixed by the name of its SDFG if nested. """
+    prefix = "" if state.sdfg.parent_sdfg is None else f"{state.sdfg.name}/"
+    return f"{prefix}{state.label}/{state.node_id(map_entry)}"
+
+
+@dataclass(eq=False)
+class EnableVectorization(ppl.Pass):
+    """
+    Optional stage after ``PermuteArrayDimensions``/``PermuteMapDimensions``: finds the innermost maps whose innermost
+    parameter now accesses every array contiguously, with unit stride and without write conflicts, and vectorizes them
+    with DaCe's ``Vectorization`` (which adds non-vectorized preamble/postamble maps for the remainder iterations).
+
+    Vector loads and stores are aligned, so every vectorized access must start on a multiple of the vector width in
+    bytes. Arrays are only assumed to be aligned to ``assumed_alignment`` bytes (16 for NumPy and ``new[]``), and
+    symbolic strides are not assumed to be multiples of the vector width, unless ``assume_aligned`` is set.
+    """
+
+    def modifies(self) -> ppl.Modifies:
+        if not self._vectorize:
+            return ppl.Modifies.Nothing
+        return ppl.Modifies.Nodes | ppl.Modifies.Memlets
+
+    def should_reapply(self, modified: ppl.Modifies) -> bool:
+        return False
+
+    def __init__(self,
+                 vector_len: int = 4,
+                 vectorize: bool = True,
+                 map_labels: Optional[Set[str]] = None,
+                 preamble: Optional[bool] = None,
+                 postamble: Optional[bool] = None,
+                 assumed_alignment: int = 16,
+                 assume_aligned: bool = False):
+        self._vector_len = vector_len
+        self._vectorize = vectorize
+        self._map_labels = map_labels
+        self._preamble = preamble
+        self._postamble = postamble
+        self._assumed_alignment = assumed_alignment
+        self._assume_aligned = assume_aligned
+
+    def apply_pass(self, sdfg: dace.SDFG, pipeline_results: Dict[str, Any]) -> VectorizationReport:
+        report = VectorizationReport()
+        options = {
+            "vector_len": self._vector_len,
+            "preamble": self._preamble,
+            "postamble": self._postamble,
+        }
+
+        candidates = []
+        for nested_sdfg in sdfg.all_sdfgs_recursive():
+            for state in nested_sdfg.all_states():
+                scope_children = state.scope_children()
+                for node in state.nodes():
+                    if not isinstance(node, dace.nodes.MapEntry):
+                        continue
+                    if self._map_labels is not None and node.map.label not in self._map_labels:
+                        continue
+                    # Only innermost maps are candidates
+                    if any(isinstance(child, dace.nodes.MapEntry) for child in scope_children[node]):
+                        continue
+                    reason = self._cannot_vectorize_reason(nested_sdfg, state, node)
+                    if reason is None and not Vectorization.can_be_applied_to(nested_sdfg, options=options,
+                                                                              map_entry=node):
+                        reason = "rejected by the Vectorization transformation"
+                    node_id = map_id(state, node)
+                    report.labels[node_id] = node.map.label
+                    if reason is not None:
+                        report.rejected[node_id] = reason
+                    else:
+                        candidates.append((nested_sdfg, node, node_id))
+
+        for nested_sdfg, map_entry, node_id in candidates:
+            if self._vectorize:
+                Vectorization.apply_to(nested_sdfg, options=options, map_entry=map_entry)
+            report.vectorized.append(node_id)
+
+        return report
+
+    def _cannot_vectorize_reason(self, sdfg: dace.SDFG, state: dace.SDFGState,
+                                 map_entry: dace.nodes.MapEntry) -> Optional[str]:
+        if map_entry.map.schedule in dace.dtypes.GPU_SCHEDULES:
+            return f"schedule {map_entry.map.schedule} is not vectorized on the CPU"
+
+        body = state.scope_subgraph(map_entry, include_entry=False, include_exit=False).nodes()
+        if len(body) != 1 or not isinstance(body[0], dace.nodes.Tasklet):
+            return "map body is not a single tasklet"
+        tasklet = body[0]
+
+        begin, _, step = map_entry.map.range[-1]
+        if step != 1:
+            return "innermost dimension is strided"
+        if self._preamble is False and (begin % self._vector_len == 0) != True:
+            return f"innermost range does not start at a multiple of the vector length {self._vector_len}"
+
+        param = dace.symbolic.pystr_to_symbolic(map_entry.map.params[-1])
+        uses_param = False
+        for edge in state.out_edges(tasklet):
+            if edge.data.wcr is not None:
+                return f"write conflict on {edge.data.data} (write-conflict resolution)"
+
+        for edge, conntype in state.all_edges_and_connectors(tasklet):
+            memlet = edge.data
+            if memlet.data is None or isinstance(sdfg.arrays[memlet.data], dace.data.Stream):
+                continue
+            if isinstance(conntype, (dace.dtypes.vector, dace.dtypes.pointer)):
+                return f"connector of {memlet.data} is already a vector or pointer"
+            is_write = edge.src is tasklet
+
+            array = sdfg.arrays[memlet.data]
+            memlet_uses_param = False
+            for dim, (dim_begin, dim_end, _) in enumerate(memlet.subset):
+                dim_symbols = (dace.symbolic.pystr_to_symbolic(dim_begin).free_symbols
+                               | dace.symbolic.pystr_to_symbolic(dim_end).free_symbols)
+                if param not in dim_symbols:
+                    continue
+                if array.strides[dim] != 1:
+                    return f"non-contiguous access to {memlet.data} (dimension {dim} has stride {array.strides[dim]})"
+                if dace.symbolic.pystr_to_symbolic(dim_begin).diff(param) != 1:
+                    return f"non-unit stride access to {memlet.data}"
+                memlet_uses_param = True
+                if not self._assume_aligned:
+                    reason = self._misalignment_reason(memlet, array, dim, param)
+                    if reason is not None:
+                        return reason
+
+            if is_write and not memlet_uses_param:
+                return f"conflicting writes to {memlet.data} (all iterations write the same element)"
+            uses_param = uses_param or memlet_uses_param
+
+        if not uses_param:
+            return "no access depends on the innermost parameter"
+        return None
+
+    def _misalignment_reason(self, memlet: dace.Memlet, array: dace.data.Data, contiguous_dim: int,
+                             param) -> Optional[str]:
+        vector_bytes = self._vector_len * array.dtype.bytes
+
+        if self._assumed_alignment % vector_bytes != 0:
+            return f"{memlet.data} is not guaranteed to be aligned to {vector_bytes} bytes"
+
+        # Every row must start aligned ...
+        for dim, stride in enumerate(array.strides):
+            if dim != contiguous_dim and ((stride * array.dtype.bytes) % vector_bytes == 0) != True:
+                return f"stride {stride} of {memlet.data} is not known to be a multiple of the vector width"
+
+        # ... and the contiguous index must be the parameter plus a multiple of the vector length, as the preamble
+        # aligns the parameter itself
+        offset = dace.symbolic.pystr_to_symbolic(memlet.subset[contiguous_dim][0]) - param
+        if ((offset + array.offset[contiguous_dim]) % self._vector_len == 0) != True:
+            return f"access to {memlet.data} is offset by {offset} elements from the vector boundary"
+        return None
@@ -0,0 +1,131 @@
+import dace
+import weakref
+from collections import defaultdict
+from dace.transformation import pass_pipeline as ppl
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set, Tuple
+
+
+@dataclass
+class KernelScope:
+    """ Contents of a map scope, collected once so that matchers do not rescan the state for every candidate map. """
+    state: dace.SDFGState
+    # Nodes between the map entry and exit, and all edges adjacent to them
+    nodes: Set[dace.nodes.Node] = field(default_factory=set)
+    edges: List[Any] = field(default_factory=list)
+    # (source storage, destination storage) -> access node to access node copy edges within the scope
+    staged_copies: Dict[Tuple[dace.dtypes.StorageType, dace.dtypes.StorageType],
+                        List[Any]] = field(default_factory=lambda: defaultdict(list))
+    # Array name -> bytes moved through the map entry and exit (symbolic)
+    footprint: Dict[str, Any] = field(default_factory=dict)
+    # Scope dictionary cached by the state at analysis time. DaCe drops it whenever nodes or edges are added or
+    # removed, which marks the entry as stale without rescanning the state.
+    _scope_dict: Any = None
+
+    def is_stale(self, map_entry: dace.nodes.MapEntry) -> bool:
+        scope_dict = getattr(self.state, "_scope_dict_toparent_cached", None)
+        return scope_dict is None or scope_dict is not self._scope_dict
+
+
+# Root SDFG -> kernel scopes of all its states. Shared by all matchers, as the pattern matcher creates a new
+# transformation instance for every candidate. Refreshed whenever KernelScopeAnalysis runs (e.g. when a pipeline
+# re-runs it because of the Modifies flags of a pass) and dropped by invalidate_kernel_scopes.
+_KERNEL_SCOPES: 'weakref.WeakKeyDictionary[dace.SDFG, Dict[dace.nodes.MapEntry, KernelScope]]' = (
+    weakref.WeakKeyDictionary())
+
+
+def analyze_state(state: dace.SDFGState) -> Dict[dace.nodes.MapEntry, KernelScope]:
+    """
+    Collects the kernel scope of every map in a state with a single sweep over its nodes and edges.
+    """
+    arrays = state.sdfg.arrays
+    scope_dict = state.scope_dict()
+    cached_scope_dict = getattr(state, "_scope_dict_toparent_cached", None)
+
+    kernels = dict()
+    exit_of_map = dict()
+    for node in state.nodes():
+        if isinstance(node, dace.nodes.MapEntry):
+            kernels[node] = KernelScope(state=state, _scope_dict=cached_scope_dict)
+        elif isinstance(node, dace.nodes.MapExit):
+            exit_of_map[node.map] = node
+
+    # Every node belongs to all scopes enclosing it (a scope does not contain its own entry and exit nodes)
+    node_scopes = dict()
+    for node in state.nodes():
+        scopes = []
+        parent = scope_dict[node]
+        if isinstance(node, dace.nodes.MapExit) and parent is not None and parent.map is node.map:
+            parent = scope_dict[parent]
+        while parent is not None:
+            scopes.append(parent)
+            parent = scope_dict[parent]
+        node_scopes[node] = scopes
+        for scope in scopes:
+            kernels[scope].nodes.add(node)
+
+    for edge in state.edges():
+        scopes = set(node_scopes[edge.src]) | set(node_scopes[edge.dst])
+        is_copy = (isinstance(edge.src, dace.nodes.AccessNode) and isinstance(edge.dst, dace.nodes.AccessNode))
+        if is_copy:
+            storage_pair = (arrays[edge.src.data].storage, arrays[edge.dst.data].storage)
+        for scope in scopes:
+            kernels[scope].edges.append(edge)
+            if is_copy:
+                kernels[scope].staged_copies[storage_pair].append(edge)
+
+    for map_entry, kernel in kernels.items():
+        boundary_edges = state.in_edges(map_entry) + state.out_edges(exit_of_map[map_entry.map])
+        for edge in boundary_edges:
+            if edge.data is None or edge.data.data is None:
+                continue
+            moved_bytes = edge.data.volume * arrays[edge.data.data].dtype.bytes
+            kernel.footprint[edge.data.data] = kernel.footprint.get(edge.data.data, 0) + moved_bytes
+
+    return kernels
+
+
+@dataclass(eq=False)
+class KernelScopeAnalysis(ppl.Pass):
+    """
+    Analysis pass that maps every map entry of an SDFG (including nested SDFGs) to its ``KernelScope``.
+    """
+
+    CATEGORY: str = 'Analysis'
+
+    def modifies(self) -> ppl.Modifies:
+        return ppl.Modifies.Nothing
+
+    def should_reapply(self, modified: ppl.Modifies) -> bool:
+        return bool(modified & (ppl.Modifies.Nodes | ppl.Modifies.Memlets | ppl.Modifies.Descriptors))
+
+    def apply_pass(self, sdfg: dace.SDFG, pipeline_results: Dict[str, Any]) -> Dict[dace.nodes.MapEntry, KernelScope]:
+        kernels = dict()
+        for nested_sdfg in sdfg.all_sdfgs_recursive():
+            for state in nested_sdfg.all_states():
+                kernels.update(analyze_state(state))
+        if sdfg is sdfg.root_sdfg:
+            _KERNEL_SCOPES[sdfg] = kernels
+        return kernels
+
+
+def kernel_scope(state: dace.SDFGState, map_entry: dace.nodes.MapEntry) -> KernelScope:
+    """
+    Returns the kernel scope of a map from the analysis of its root SDFG, which is computed on first use and shared
+    across lookups. States whose nodes or edges changed since are re-swept on their own. Changes that keep the graph
+    structure (e.g. storage types or memlets) are only picked up once the analysis is re-run or invalidated.
+    """
+    root_sdfg = state.sdfg.root_sdfg
+    kernels = _KERNEL_SCOPES.get(root_sdfg)
+    if kernels is None:
+        kernels = KernelScopeAnalysis().apply_pass(root_sdfg, {})
+    kernel = kernels.get(map_entry)
+    if kernel is None or kernel.is_stale(map_entry):
+        kernels.update(analyze_state(state))
+        kernel = kernels[map_entry]
+    return kernel
+
+
+def invalidate_kernel_scopes(sdfg: dace.SDFG) -> None:
+    """ Drops the shared analysis of the root SDFG of ``sdfg``, e.g. after changing it outside of a pipeline. """
+    _KERNEL_SCOPES.pop(sdfg.root_sdfg, None)
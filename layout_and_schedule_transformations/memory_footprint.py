@@ -0,0 +1,154 @@
+import copy
+import dace
+from collections import defaultdict
+from dace.transformation import pass_pipeline as ppl
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
+
+# Transients with these lifetimes are allocated for the whole SDFG, independent of where they are accessed
+_SDFG_LIFETIMES = {
+    dace.dtypes.AllocationLifetime.SDFG,
+    dace.dtypes.AllocationLifetime.Global,
+    dace.dtypes.AllocationLifetime.Persistent,
+    dace.dtypes.AllocationLifetime.External,
+}
+
+
+@dataclass
+class MemoryFootprint:
+    # State -> storage type -> bytes of the transients live during the state, including those of nested SDFGs
+    live_bytes: Dict[dace.SDFGState, Dict[dace.dtypes.StorageType, int]] = field(default_factory=dict)
+    # State -> transients live during the state, those of nested SDFGs as "<nested SDFG>.<name>"
+    live_arrays: Dict[dace.SDFGState, Set[str]] = field(default_factory=dict)
+
+    def state_bytes(self, state: dace.SDFGState, storage: Optional[dace.dtypes.StorageType] = None) -> int:
+        per_storage = self.live_bytes.get(state, {})
+        if storage is None:
+            return sum(per_storage.values())
+        return per_storage.get(storage, 0)
+
+    def peak(self, storage: Optional[dace.dtypes.StorageType] = None) -> int:
+        return max((self.state_bytes(state, storage) for state in self.live_bytes), default=0)
+
+    def peak_state(self, storage: Optional[dace.dtypes.StorageType] = None) -> Optional[dace.SDFGState]:
+        if not self.live_bytes:
+            return None
+        return max(self.live_bytes, key=lambda state: self.state_bytes(state, storage))
+
+    def by_label(self, storage: Optional[dace.dtypes.StorageType] = None) -> Dict[str, int]:
+        """ Live bytes per state label, to compare footprints of different copies of an SDFG. """
+        return {state.label: self.state_bytes(state, storage) for state in self.live_bytes}
+
+
+def data_bytes(desc: dace.data.Data, symbols: Dict[str, int]) -> int:
+    """ Size of a data descriptor in bytes, with the symbols in its shape replaced by the given values. """
+    size = desc.total_size * desc.dtype.bytes
+    if not dace.symbolic.issymbolic(size):
+        return int(size)
+    missing = sorted(str(s) for s in size.free_symbols if str(s) not in symbols)
+    if missing:
+        raise ValueError(f"Cannot evaluate the size {size} of a data descriptor, symbols {missing} have no value")
+    return int(dace.symbolic.evaluate(size, symbols))
+
+
+def _sdfg_footprint(sdfg: dace.SDFG, symbols: Dict[str, int],
+                    prefix: str) -> Dict[dace.SDFGState, Tuple[Dict[dace.dtypes.StorageType, int], Set[str]]]:
+    accessed_in = defaultdict(set)
+    for state in sdfg.all_states():
+        for node in state.data_nodes():
+            accessed_in[node.data].add(state)
+
+    # Scope- and state-lifetime transients are allocated in the state using them, or for the whole SDFG if
+    # several states use them. Transients that are never accessed are not allocated.
+    sdfg_live = set()
+    state_live = defaultdict(set)
+    for name, desc in sdfg.arrays.items():
+        if not desc.transient or isinstance(desc, dace.data.View):
+            continue
+        if desc.lifetime in _SDFG_LIFETIMES or len(accessed_in[name]) > 1:
+            sdfg_live.add(name)
+        else:
+            for state in accessed_in[name]:
+                state_live[state].add(name)
+
+    footprint = dict()
+    for state in sdfg.all_states():
+        per_storage = defaultdict(int)
+        names = set()
+        for name in sdfg_live | state_live[state]:
+            desc = sdfg.arrays[name]
+            per_storage[desc.storage] += data_bytes(desc, symbols)
+            names.add(prefix + name)
+
+        # A nested SDFG adds the footprint of its most expensive state
+        for node in state.nodes():
+            if not isinstance(node, dace.nodes.NestedSDFG):
+                continue
+            nested_symbols = dict(symbols)
+            for symbol, value in node.symbol_mapping.items():
+                try:
+                    nested_symbols[symbol] = int(dace.symbolic.evaluate(value, symbols))
+                except Exception:
+                    # Depends on map parameters or other symbols without a value, unused by the sizes if valid
+                    nested_symbols.pop(symbol, None)
+            nested = _sdfg_footprint(node.sdfg, nested_symbols, prefix + node.sdfg.name + ".")
+            if nested:
+                nested_storage, nested_names = max(nested.values(), key=lambda entry: sum(entry[0].values()))
+                for storage, size in nested_storage.items():
+                    per_storage[storage] += size
+                names |= nested_names
+
+        footprint[state] = (dict(per_storage), names)
+    return footprint
+
+
+def memory_footprint(sdfg: dace.SDFG, symbols: Optional[Dict[str, int]] = None) -> MemoryFootprint:
+    """
+    Computes the transient bytes live during every state of an SDFG, with the symbolic sizes evaluated at the given
+    symbol values. Nested SDFGs are counted once, even if they are replicated by an enclosing parallel map.
+    """
+    symbols = dict(symbols or {})
+    for name, value in sdfg.constants.items():
+        symbols.setdefault(name, value)
+    result = MemoryFootprint()
+    for state, (per_storage, names) in _sdfg_footprint(sdfg, symbols, "").items():
+        result.live_bytes[state] = per_storage
+        result.live_arrays[state] = names
+    return result
+
+
+def footprint_before_after(sdfg: dace.SDFG,
+                           transformation: Union[ppl.Pass, Callable[[dace.SDFG], Any]],
+                           symbols: Optional[Dict[str, int]] = None) -> Tuple[MemoryFootprint, MemoryFootprint]:
+    """
+    Computes the footprint of an SDFG and of a copy of it with a pass (or a callable) applied. The SDFG itself is
+    not modified, compare the states of the two footprints with ``MemoryFootprint.by_label``.
+    """
+    transformed_sdfg = copy.deepcopy(sdfg)
+    if isinstance(transformation, ppl.Pass):
+        transformation.apply_pass(transformed_sdfg, {})
+    else:
+        transformation(transformed_sdfg)
+    return memory_footprint(sdfg, symbols), memory_footprint(transformed_sdfg, symbols)
+
+
+@dataclass(eq=False)
+class MemoryFootprintAnalysis(ppl.Pass):
+    """
+    Analysis pass that computes the ``MemoryFootprint`` of an SDFG at the given symbol values.
+    """
+
+    CATEGORY: str = 'Analysis'
+
+    def __init__(self, symbols: Optional[Dict[str, int]] = None):
+        self._symbols = symbols or dict()
+
+    def modifies(self) -> ppl.Modifies:
+        return ppl.Modifies.Nothing
+
+    def should_reapply(self, modified: ppl.Modifies) -> bool:
+        return bool(modified & (ppl.Modifies.States | ppl.Modifies.AccessNodes | ppl.Modifies.Descriptors
+                                | ppl.Modifies.NestedSDFGs))
+
+    def apply_pass(self, sdfg: dace.SDFG, pipeline_results: Dict[str, Any]) -> MemoryFootprint:
+        return memory_footprint(sdfg, self._symbols)
@@ -0,0 +1,52 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class TransformationStatistics:
+    """
+    What a pass changed and how long it took. Returned by ``PermuteArrayDimensions`` and ``PermuteMapDimensions``, and
+    therefore stored in ``pipeline_results`` under the class name when run in a pipeline.
+    """
+    arrays_changed: List[str] = field(default_factory=list)
+    maps_changed: List[str] = field(default_factory=list)
+    memlets_rewritten: int = 0
+    nested_sdfgs_visited: int = 0
+    copy_states_added: int = 0
+    # Bytes moved by the added copies, symbolic if the array sizes are
+    copy_bytes_added: Any = 0
+    # Phase name -> wall time in seconds
+    phase_times: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.phase_times.values())
+
+    def add_phase_time(self, name: str, seconds: float) -> None:
+        self.phase_times[name] = self.phase_times.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase_time(name, time.perf_counter() - start)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ JSON-serializable form, symbolic byte counts are converted to strings. """
+        try:
+            copy_bytes = int(self.copy_bytes_added)
+        except TypeError:
+            copy_bytes = str(self.copy_bytes_added)
+        return {
+            "arrays_changed": list(self.arrays_changed),
+            "maps_changed": list(self.maps_changed),
+            "memlets_rewritten": self.memlets_rewritten,
+            "nested_sdfgs_visited": self.nested_sdfgs_visited,
+            "copy_states_added": self.copy_states_added,
+            "copy_bytes_added": copy_bytes,
+            "phase_times": dict(self.phase_times),
+        }
@@ -1,39 +1,97 @@
+import copy
 import dace
-from typing import Dict, List, Any
+import time
+import warnings
+from collections import Counter, defaultdict
+from typing import Dict, List, Any, Optional, Set, Tuple
+from dace.sdfg.state import ControlFlowBlock, LoopRegion
 from dace.transformation import pass_pipeline as ppl
 from dataclasses import dataclass
+from layout_and_schedule_transformations.memory_footprint import memory_footprint
+from layout_and_schedule_transformations.pass_statistics import TransformationStatistics
 
 
-@dataclass
+@dataclass(eq=False)
 class PermuteArrayDimensions(ppl.Pass):
     def modifies(self) -> ppl.Modifies:
-        # This is an analysis pass, so it does not modify anything
-        return (ppl.Modifies.States & ppl.Modifies.AccessNodes &
-            ppl.Modifies.Edges & ppl.Modifies.Descriptors &
-            ppl.Modifies.NestedSDFGs & ppl.Modifies.Memlets)
+        # Adds permute states (and loops over slabs, with their symbols), replaces descriptors and rewrites memlets
+        return (ppl.Modifies.States | ppl.Modifies.CFG | ppl.Modifies.AccessNodes |
+            ppl.Modifies.Edges | ppl.Modifies.Descriptors | ppl.Modifies.Symbols |
+            ppl.Modifies.NestedSDFGs | ppl.Modifies.Memlets)
 
     def __init__(self,
                  permute_map: Dict[str, List[int]],
-                 add_permute_maps: bool):
+                 add_permute_maps: bool,
+                 first_touch: bool = False,
+                 memory_budget: Optional[int] = None,
+                 budget_symbols: Optional[Dict[str, int]] = None,
+                 slab_size: Optional[int] = None,
+                 slab_dim: int = 0):
         self._permute_map = permute_map
         self._add_permute_maps = add_permute_maps
+        # Partition the copy-in maps like the dominant consumer of each permuted array, such that the pages of the
+        # permuted arrays are first touched by the threads that use them later (NUMA placement). The consumers are
+        # analyzed as they are when this pass runs, so PermuteMapDimensions has to be applied before, not after it.
+        self._first_touch = first_touch
+        # Maximum peak of live transient bytes (see memory_footprint) with the symbols set to budget_symbols.
+        # If the transformed SDFG would exceed it, the pass refuses to run and leaves the SDFG unchanged.
+        self._memory_budget = memory_budget
+        self._budget_symbols = budget_symbols or dict()
+        # Streaming mode: each permute map copies slabs of slab_size elements along dimension slab_dim of the array
+        # it writes, in a sequential loop. Slabs along dimension 0 are contiguous in the destination. The permuted
+        # arrays keep their full size, the loop only bounds the data touched per iteration.
+        if slab_size is not None and slab_size <= 0:
+            raise ValueError(f"The slab size must be positive, got {slab_size}")
+        self._slab_size = slab_size
+        self._slab_dim = slab_dim
+        self._statistics = TransformationStatistics()
 
     def should_reapply(self, modified: ppl.Modifies) -> bool:
         return False
 
-    def apply_pass(self, sdfg: dace.SDFG, pipeline_results: Dict[str, Any]) -> int:
+    def apply_pass(self, sdfg: dace.SDFG, pipeline_results: Dict[str, Any]) -> Optional[TransformationStatistics]:
+        statistics = TransformationStatistics()
+        if self._memory_budget is not None:
+            with statistics.phase("budget"):
+                fits = self._fits_budget(sdfg)
+            if not fits:
+                return None
+        self._statistics = statistics
         self._permute_index(sdfg, sdfg, self._permute_map, self._add_permute_maps)
-        return 0
+        return statistics
+
+    def _fits_budget(self, sdfg: dace.SDFG) -> bool:
+        # Tries the transformation on a copy of the SDFG
+        trial_sdfg = copy.deepcopy(sdfg)
+        self._statistics = TransformationStatistics()
+        self._permute_index(trial_sdfg, trial_sdfg, self._permute_map, self._add_permute_maps)
+        peak = memory_footprint(trial_sdfg, self._budget_symbols).peak()
+        if peak <= self._memory_budget:
+            return True
+        warnings.warn(f"PermuteArrayDimensions not applied to {sdfg.name}: the peak of live transients would be "
+                      f"{peak} bytes, the budget is {self._memory_budget} bytes")
+        return False
 
     def _add_permute_map(self, sdfg: dace.SDFG, state: dace.SDFGState,
                          old_shape: List[int], new_shape: List[int],
-                         permute_indices: List[int], old_name: str, new_name: str):
+                         permute_indices: List[int], old_name: str, new_name: str,
+                         dst_ranges: Optional[Dict[int, str]] = None):
         old_access = state.add_access(old_name)
         new_access = state.add_access(new_name)
         range_dict = dict()
         assert len(old_shape) == len(new_shape), f"Old shape {old_shape} and new shape {new_shape} must have the same length"
         for i in range(len(old_shape)):
-            range_dict[f"i{i}"] = f"0:{new_shape[i]}" # Could use old shape too
+            # i{i} indexes dimension i of the source array
+            range_dict[f"i{i}"] = f"0:{old_shape[i]}"
+        old_subset = list(range_dict.values())
+        new_subset = [f"0:{s}" for s in new_shape]
+
+        # Only copy the given ranges of some dimensions of the destination (e.g. a slab, or the halo of a partition)
+        for dst_dim, dst_range in (dst_ranges or dict()).items():
+            src_dim = permute_indices[dst_dim]
+            range_dict[f"i{src_dim}"] = dst_range
+            old_subset[src_dim] = dst_range
+            new_subset[dst_dim] = dst_range
 
         # Add map that computes B[permute_indices[i], ..., permute_indices[k]] = A[i, j, ..., k]
         map_entry, map_exit = state.add_map("permute_impl", range_dict)
@@ -45,14 +103,151 @@ class PermuteArrayDimensions(ppl.Pass):
         map_exit.add_in_connector("IN_" + new_name)
         map_exit.add_out_connector("OUT_" + new_name)
         state.add_edge(old_access, None, map_entry, "IN_" + old_name,
-                dace.Memlet.from_array(old_name, sdfg.arrays[old_name]))
+                dace.Memlet(data=old_name, subset=", ".join(old_subset)))
         state.add_edge(map_exit, "OUT_" + new_name, new_access, None,
-                dace.Memlet.from_array(new_name, sdfg.arrays[new_name]))
+                dace.Memlet(data=new_name, subset=", ".join(new_subset)))
         assign_tasklet = state.add_tasklet("assign", {"_in1"}, {"_out1"}, f"_out1 = _in1")
         state.add_edge(map_entry, "OUT_" + old_name, assign_tasklet, "_in1",
                 dace.Memlet(expr=f"{old_name}[{src_access}]"))
         state.add_edge(assign_tasklet, "_out1", map_exit, "IN_" + new_name,
                 dace.Memlet(expr=f"{new_name}[{dst_access}]"))
+        return map_entry
+
+    def _add_slab_loop(self, sdfg: dace.SDFG, after: ControlFlowBlock, label: str,
+                       extent: Any) -> Tuple[LoopRegion, dace.SDFGState, str]:
+        # Adds a sequential loop over the slabs of a dimension with the given extent directly after a block
+        slab_var = sdfg.find_new_symbol(f"slab_{label}")
+        sdfg.add_symbol(slab_var, dace.int64)
+        loop = LoopRegion(label,
+                          condition_expr=f"{slab_var} < {extent}",
+                          loop_var=slab_var,
+                          initialize_expr=f"{slab_var} = 0",
+                          update_expr=f"{slab_var} = {slab_var} + {self._slab_size}")
+        sdfg.add_node(loop)
+        for edge in list(sdfg.out_edges(after)):
+            sdfg.add_edge(loop, edge.dst, edge.data)
+            sdfg.remove_edge(edge)
+        sdfg.add_edge(after, loop, dace.InterstateEdge())
+        body = loop.add_state(label + "_slab", is_start_block=True)
+        return loop, body, slab_var
+
+    def _add_copy(self, sdfg: dace.SDFG, state: dace.SDFGState, last_block: ControlFlowBlock,
+                  states_to_skip: Set[dace.SDFGState], old_shape: List[int], new_shape: List[int],
+                  permute_indices: List[int], old_name: str, new_name: str) -> Tuple[dace.nodes.MapEntry,
+                                                                                      ControlFlowBlock]:
+        # Adds a permute map to the state, or in streaming mode to a slab loop after last_block.
+        # Returns the map entry and the block that further copies go after.
+        self._statistics.copy_bytes_added += sdfg.arrays[old_name].total_size * sdfg.arrays[old_name].dtype.bytes
+        if self._slab_size is None:
+            return self._add_permute_map(sdfg=sdfg, state=state, old_shape=old_shape, new_shape=new_shape,
+                                         permute_indices=permute_indices, old_name=old_name,
+                                         new_name=new_name), last_block
+        if not 0 <= self._slab_dim < len(new_shape):
+            raise ValueError(f"Cannot stream {new_name} in slabs along dimension {self._slab_dim}, it has "
+                             f"{len(new_shape)} dimensions")
+        loop, body, slab_var = self._add_slab_loop(sdfg, last_block, f"{state.label}_{new_name}",
+                                                   new_shape[self._slab_dim])
+        states_to_skip.add(body)
+        # Only copy the slab [slab_var, slab_var + slab_size) of dimension slab_dim of the destination
+        slab_range = f"{slab_var}:min({slab_var} + {self._slab_size}, {new_shape[self._slab_dim]})"
+        map_entry = self._add_permute_map(sdfg=sdfg, state=body, old_shape=old_shape, new_shape=new_shape,
+                                          permute_indices=permute_indices, old_name=old_name, new_name=new_name,
+                                          dst_ranges={self._slab_dim: slab_range})
+        return map_entry, loop
+
+    def _dominant_consumer(self, sdfg: dace.SDFG, data: str,
+                           states_to_skip: Set[dace.SDFGState]) -> Optional[Tuple[dace.nodes.MapEntry, int, Any]]:
+        # The dominant consumer is the top-level CPU map with the most accesses to the array. Its outermost parameter
+        # is the one OpenMP partitions, return the map, the dimension of the array it indexes and the offset of the
+        # index from the parameter (the median one of all accesses, e.g. 0 for i - 1, i, i + 1), or None if the index
+        # is not the parameter plus a constant
+        best, best_accesses = None, 0
+        for state in sdfg.all_states():
+            if state in states_to_skip:
+                continue
+            scope_dict = state.scope_dict()
+            for node in state.nodes():
+                if (not isinstance(node, dace.nodes.MapEntry) or scope_dict[node] is not None
+                        or node.map.schedule not in (dace.dtypes.ScheduleType.Default,
+                                                     dace.dtypes.ScheduleType.CPU_Multicore)):
+                    continue
+                outer_param = dace.symbolic.pystr_to_symbolic(node.map.params[0])
+                accesses = 0
+                dims = Counter()
+                offsets = defaultdict(list)
+                for edge in state.scope_subgraph(node).edges():
+                    if edge.data.data != data or edge.data.subset is None:
+                        continue
+                    accesses += 1
+                    for dim, (begin, _, _) in enumerate(edge.data.subset.ndrange()):
+                        begin = dace.symbolic.pystr_to_symbolic(begin)
+                        if outer_param not in begin.free_symbols:
+                            continue
+                        dims[dim] += 1
+                        if begin.diff(outer_param) == 1:
+                            offsets[dim].append(dace.symbolic.simplify(begin - outer_param))
+                if dims and accesses > best_accesses:
+                    dim, count = dims.most_common(1)[0]
+                    offset = None
+                    if len(offsets[dim]) == count:
+                        try:
+                            offset = sorted(offsets[dim])[count // 2]
+                        except TypeError:
+                            # Symbolic offsets cannot be ordered
+                            offset = Counter(offsets[dim]).most_common(1)[0][0]
+                    best, best_accesses = (node, dim, offset), accesses
+        return best
+
+    def _align_first_touch(self, sdfg: dace.SDFG,
+                           permute_in_maps: Dict[str, Tuple[dace.SDFGState, dace.nodes.MapEntry, str, List[int]]],
+                           states_to_skip: Set[dace.SDFGState]):
+        # The consumers are analyzed as they are when this pass runs: apply PermuteMapDimensions before this pass, the
+        # outermost parameter of a consumer must not change anymore.
+        for new_name, (state, map_entry, old_name, permute_indices) in permute_in_maps.items():
+            consumer = self._dominant_consumer(sdfg, new_name, states_to_skip)
+            if consumer is None:
+                continue
+            consumer_entry, dim, offset = consumer
+
+            # Dimension dim of the permuted array is written with i{permute_indices[dim]}, make it the outermost one
+            params = list(map_entry.map.params)
+            ranges = list(map_entry.map.range)
+            outer = params.index(f"i{permute_indices[dim]}")
+            order = [outer] + [k for k in range(len(params)) if k != outer]
+            map_entry.map.params = [params[k] for k in order]
+            map_entry.map.range = dace.subsets.Range([ranges[k] for k in order])
+
+            map_entry.map.schedule = consumer_entry.map.schedule
+            map_entry.map.omp_schedule = consumer_entry.map.omp_schedule
+            map_entry.map.omp_chunk_size = consumer_entry.map.omp_chunk_size
+            map_entry.map.omp_num_threads = consumer_entry.map.omp_num_threads
+
+            # Iterate over the same range as the consumer (e.g. without its halo), such that a static schedule gives
+            # every thread the same part of the array in both maps. The rest is copied by separate, smaller maps.
+            # In streaming mode the copies are in slab loops instead of the given state, only their order and schedule
+            # are aligned
+            begin, end, step = consumer_entry.map.range[0]
+            if offset is None or step != 1 or self._slab_size is not None:
+                continue
+            extent = sdfg.arrays[new_name].shape[dim]
+            partition = (begin + offset, end + offset, 1)
+            map_entry.map.range = dace.subsets.Range([partition] + list(map_entry.map.range)[1:])
+            for edge in state.in_edges(map_entry):
+                edge.data.subset = dace.subsets.Range([partition if k == permute_indices[dim] else r
+                                                       for k, r in enumerate(edge.data.subset)])
+            for edge in state.out_edges(state.exit_node(map_entry)):
+                edge.data.subset = dace.subsets.Range([partition if k == dim else r
+                                                       for k, r in enumerate(edge.data.subset)])
+
+            halos = []
+            if dace.symbolic.simplify(begin + offset) != 0:
+                halos.append(f"0:{begin + offset}")
+            if dace.symbolic.simplify(extent - (end + offset + 1)) != 0:
+                halos.append(f"{end + offset + 1}:{extent}")
+            for halo in halos:
+                self._add_permute_map(sdfg=sdfg, state=state, old_shape=sdfg.arrays[old_name].shape,
+                                      new_shape=sdfg.arrays[new_name].shape, permute_indices=permute_indices,
+                                      old_name=old_name, new_name=new_name, dst_ranges={dim: halo})
 
     def _inverse_permute_indices(self, permute_indices: List[int]) -> List[int]:
         # implicit([0, 1, 2, 3]) -> [0, 3, 1, 2]
@@ -67,11 +262,20 @@ class PermuteArrayDimensions(ppl.Pass):
         inverse_perm = [inverse_map[i] for i in sorted(inverse_map)]
         return inverse_perm
 
+    def _record_phase(self, root: dace.SDFG, sdfg: dace.SDFG, name: str, start: float) -> float:
+        # Phases are only timed in the root SDFG, nested SDFGs are part of its "nested_sdfgs" phase
+        now = time.perf_counter()
+        if root == sdfg:
+            self._statistics.add_phase_time(name, now - start)
+        return now
+
     def _permute_index(self, root: dace.SDFG, sdfg: dace.SDFG, permute_map : Dict[str, List[int]], add_permute_maps: bool):
         # If top-level SDFG, namely the root is equal to the sdfg, we might need to add a transpose state and maps to
         # permute the arrays, otherwise we just replace the arrays with the permuted shape
+        phase_start = time.perf_counter()
         name_map = dict()
         permute_states_to_skip = set()
+        permute_in_maps = dict()
         for arr_name, arr in list(sdfg.arrays.items()):
             if arr_name in permute_map:
                 permute_indices = permute_map[arr_name]
@@ -108,6 +312,8 @@ class PermuteArrayDimensions(ppl.Pass):
                     sdfg.add_datadesc(name=arr_name, datadesc=permuted_arr) # Need to transpose memlets before validation
 
                 name_map[arr_name] = "permuted_" + arr_name if (add_permute_maps and root == sdfg) else arr_name
+                self._statistics.arrays_changed.append(arr_name if root == sdfg else f"{sdfg.name}.{arr_name}")
+        phase_start = self._record_phase(root, sdfg, "descriptors", phase_start)
 
         if root == sdfg:
             if add_permute_maps:
@@ -118,21 +324,26 @@ class PermuteArrayDimensions(ppl.Pass):
                 permute_states_to_skip.add(permute_out_state)
 
                 # Add maps to permute the input arrays to their permuted shape
+                last_block = permute_state
                 for old_name, new_name in name_map.items():
                     old_shape = sdfg.arrays[old_name].shape
                     new_shape = sdfg.arrays[new_name].shape
                     permute_indices = permute_map[old_name]
                     # Only non-transient glb arrays are input arrays
                     if sdfg.arrays[old_name].transient is False:
-                        self._add_permute_map(sdfg=sdfg,
+                        map_entry, last_block = self._add_copy(sdfg=sdfg,
                                             state=permute_state,
+                                            last_block=last_block,
+                                            states_to_skip=permute_states_to_skip,
                                             old_shape=old_shape,
                                             new_shape=new_shape,
                                             permute_indices=permute_indices,
                                             old_name=old_name,
                                             new_name=new_name)
+                        permute_in_maps[new_name] = (permute_state, map_entry, old_name, permute_indices)
 
                 # Add maps to permute the arrays back to their original shape
+                last_block = permute_out_state
                 for old_name, new_name in name_map.items():
                     old_shape = sdfg.arrays[old_name].shape
                     new_shape = sdfg.arrays[new_name].shape
@@ -140,13 +351,17 @@ class PermuteArrayDimensions(ppl.Pass):
                     inverse_permute_indices = self._inverse_permute_indices(permute_map[old_name])
                     # Only non-transient glb arrays are output arrays
                     if sdfg.arrays[old_name].transient is False:
-                        self._add_permute_map(sdfg=sdfg,
+                        _, last_block = self._add_copy(sdfg=sdfg,
                                             state=permute_out_state,
+                                            last_block=last_block,
+                                            states_to_skip=permute_states_to_skip,
                                             old_shape=new_shape,
                                             new_shape=old_shape,
                                             permute_indices=inverse_permute_indices,
                                             old_name=new_name,
                                             new_name=old_name)
+                self._statistics.copy_states_added += len(permute_states_to_skip)
+        phase_start = self._record_phase(root, sdfg, "copies", phase_start)
 
         # The transformation has added the permuted shapes and maps to permute them if the user requested it.
         # The transformation has yet permuted the memlets as we want to access the previous defined arrays
@@ -173,7 +388,9 @@ class PermuteArrayDimensions(ppl.Pass):
                         dst_name = oe.data.data
                         if dst_name in permute_map  and sdfg.arrays[dst_name].shape == node.sdfg.arrays[src_name].shape:
                             new_permute_map[src_name] = permute_map[dst_name]
+                    self._statistics.nested_sdfgs_visited += 1
                     self._permute_index(root=root, sdfg=node.sdfg, permute_map=new_permute_map, add_permute_maps=False)
+        phase_start = self._record_phase(root, sdfg, "nested_sdfgs", phase_start)
 
         for state in sdfg.all_states():
             if sdfg == root and (state in permute_states_to_skip):
@@ -206,4 +423,9 @@ class PermuteArrayDimensions(ppl.Pass):
                     for i in range(len(permute_indices)):
                         new_subset.append(edge.data.subset[permute_indices[i]])
                     edge.data.subset = dace.subsets.Range(new_subset)
+                    self._statistics.memlets_rewritten += 1
+        phase_start = self._record_phase(root, sdfg, "memlets", phase_start)
 
+        if root == sdfg and self._first_touch:
+            self._align_first_touch(sdfg, permute_in_maps, permute_states_to_skip)
+            self._record_phase(root, sdfg, "first_touch", phase_start)
@@ -3,12 +3,13 @@ from typing import Dict, List, Any
 from dace.transformation.dataflow.map_dim_shuffle import MapDimShuffle
 from dace.transformation import pass_pipeline as ppl
 from dataclasses import dataclass
+from layout_and_schedule_transformations.pass_statistics import TransformationStatistics
 
 
-@dataclass
+@dataclass(eq=False)
 class PermuteMapDimensions(ppl.Pass):
     def modifies(self) -> ppl.Modifies:
-        return ppl.Modifies.Nodes & ppl.Modifies.Memlets
+        return ppl.Modifies.Nodes | ppl.Modifies.Memlets
 
     def should_reapply(self, modified: ppl.Modifies) -> bool:
         return False
@@ -21,34 +22,42 @@ class PermuteMapDimensions(ppl.Pass):
         else:
             self._permute_map_node = permute_map
         self._use_labels = use_labels
+        self._statistics = TransformationStatistics()
 
-    def apply_pass(self, sdfg: dace.SDFG, pipeline_results: Dict[str, Any]) -> int:
+    def apply_pass(self, sdfg: dace.SDFG, pipeline_results: Dict[str, Any]) -> TransformationStatistics:
+        self._statistics = TransformationStatistics()
+        self._statistics.nested_sdfgs_visited = len(list(sdfg.all_sdfgs_recursive())) - 1
         if self._use_labels:
             self._permute_map_dimensions_from_label(sdfg, self._permute_map_label)
         else:
             self._permute_map_dimensions(sdfg, self._permute_map_node)
+        return self._statistics
 
-        return 0
 
-
-    def _permute_map_dimensions_from_label(self, sdfg: dace.SDFG, permute_map : Dict[dace.nodes.MapEntry, List[int]]):
+    def _permute_map_dimensions_from_label(self, sdfg: dace.SDFG, permute_map : Dict[str, List[int]]):
         permute_map_from_nodes = dict()
-        for state, _ in sdfg.all_nodes_recursive():
-            if isinstance(state, dace.SDFGState):
-                for node in state.nodes():
-                    if isinstance(node, dace.nodes.MapEntry):
-                        if node.map.label in permute_map:
-                            permute_map_from_nodes[node] = permute_map[node.map.label]
+        with self._statistics.phase("match"):
+            for state, _ in sdfg.all_nodes_recursive():
+                if isinstance(state, dace.SDFGState):
+                    for node in state.nodes():
+                        if isinstance(node, dace.nodes.MapEntry):
+                            if node.map.label in permute_map:
+                                permute_map_from_nodes[node] = permute_map[node.map.label]
         self._permute_map_dimensions(sdfg, permute_map_from_nodes)
 
-    def _permute_map_dimensions(self, sdfg: dace.SDFG, permute_map : Dict[str, List[int]]):
-        for state, _ in sdfg.all_nodes_recursive():
-            if isinstance(state, dace.SDFGState):
-                for node in state.nodes():
-                    if isinstance(node, dace.nodes.MapEntry):
-                        old_params = node.map.params
-                        new_params = []
-                        if node.map.label in permute_map:
-                            for j in range(len(permute_map[node.map.label])):
-                                new_params.append(old_params[permute_map[node.map.label][j]])
-                            MapDimShuffle.apply_to(sdfg, map_entry=node, options={"parameters": new_params})
\ No newline at end of file
+    def _permute_map_dimensions(self, sdfg: dace.SDFG,
+                                permute_map : Dict[dace.nodes.MapEntry, List[int]] | Dict[str, List[int]]):
+        # Maps are looked up by their entry node, then by their label
+        with self._statistics.phase("shuffle"):
+            for state, _ in sdfg.all_nodes_recursive():
+                if isinstance(state, dace.SDFGState):
+                    for node in state.nodes():
+                        if isinstance(node, dace.nodes.MapEntry):
+                            old_params = node.map.params
+                            new_params = []
+                            permute_indices = permute_map.get(node, permute_map.get(node.map.label))
+                            if permute_indices is not None:
+                                for j in range(len(permute_indices)):
+                                    new_params.append(old_params[permute_indices[j]])
+                                MapDimShuffle.apply_to(sdfg, map_entry=node, options={"parameters": new_params})
+                                self._statistics.maps_changed.append(node.map.label)
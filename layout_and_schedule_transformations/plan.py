@@ -0,0 +1,137 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from layout_and_schedule_transformations.registry import get_spec, REGISTRY
+
+# Like the registry, this module only imports dace when a plan is applied.
+
+
+@dataclass
+class TransformationStep:
+    name: str
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    def validate(self) -> None:
+        """ Raises a ``ValueError`` if the step names an unknown transformation or has invalid options. """
+        if self.name not in REGISTRY:
+            raise ValueError(f"Unknown transformation {self.name}, known transformations are {sorted(REGISTRY)}")
+        spec = get_spec(self.name)
+
+        missing = [o for o in spec.required_options if o not in self.options]
+        if missing:
+            raise ValueError(f"{self.name} is missing the options {missing}")
+        unknown = [o for o in self.options if o not in spec.options]
+        if unknown:
+            raise ValueError(f"{self.name} has unknown options {unknown}, expected a subset of {list(spec.options)}")
+
+        for option, value in self.options.items():
+            if option in ("add_permute_maps", "use_labels", "first_touch") and not isinstance(value, bool):
+                raise ValueError(f"Option {option} of {self.name} must be a bool, got {value!r}")
+            if option in spec.enum_options and value is not None and not isinstance(value, str):
+                raise ValueError(f"Option {option} of {self.name} must be the name of a "
+                                 f"dace.dtypes.{spec.enum_options[option]}, got {value!r}")
+
+        if "permute_map" in self.options:
+            self._validate_permute_map(self.options["permute_map"])
+        # Map entries cannot be named in a plan, maps are selected by their labels
+        if self.options.get("use_labels") is False:
+            raise ValueError(f"{self.name} in a plan must select maps by label (use_labels=True)")
+
+    def _validate_permute_map(self, permute_map: Any) -> None:
+        if not isinstance(permute_map, dict):
+            raise ValueError(f"permute_map of {self.name} must map names to permutations, got {permute_map!r}")
+        for name, permutation in permute_map.items():
+            if (not isinstance(name, str) or not isinstance(permutation, (list, tuple))
+                    or sorted(permutation) != list(range(len(permutation)))):
+                raise ValueError(f"permute_map of {self.name} maps {name!r} to {permutation!r}, which is not a "
+                                 f"permutation of [0, ..., n-1]")
+
+
+@dataclass
+class TransformationPlan:
+    """
+    Ordered list of transformations to apply to an SDFG, given by name (see ``registry.REGISTRY``) and options.
+    Plans can be parsed, validated, serialized and dispatched to worker processes without importing dace; dace is
+    only imported once a plan is applied.
+
+    The JSON form is a list of steps, e.g.
+    ``[{"transformation": "PermuteArrayDimensions", "options": {"permute_map": {"A": [1, 0]}, ...}}]``.
+    """
+    steps: List[TransformationStep] = field(default_factory=list)
+
+    @classmethod
+    def from_list(cls, steps: Sequence[Dict[str, Any]]) -> 'TransformationPlan':
+        plan = cls()
+        for step in steps:
+            if not isinstance(step, dict) or "transformation" not in step:
+                raise ValueError(f"Plan step {step!r} must be a dictionary with a 'transformation' entry")
+            plan.steps.append(TransformationStep(name=step["transformation"], options=dict(step.get("options", {}))))
+        return plan
+
+    @classmethod
+    def from_json(cls, text: str) -> 'TransformationPlan':
+        return cls.from_list(json.loads(text))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return [{"transformation": step.name, "options": step.options} for step in self.steps]
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_list())
+
+    def validate(self) -> None:
+        for step in self.steps:
+            step.validate()
+
+    def apply(self, sdfg) -> Dict[str, Any]:
+        """
+        Applies the steps in order to the SDFG. Passes get the results of the previous steps, pattern
+        transformations are applied to their first match.
+
+        :return: The result of every step, keyed by the transformation name.
+        """
+        self.validate()
+        pipeline_results = dict()
+        for step in self.steps:
+            spec = get_spec(step.name)
+            transformation_class = spec.load()
+            options = spec.convert_options(step.options)
+            if spec.kind == "pass":
+                pipeline_results[step.name] = transformation_class(**options).apply_pass(sdfg, pipeline_results)
+            else:
+                pipeline_results[step.name] = sdfg.apply_transformations(transformation_class, options=options)
+        return pipeline_results
+
+
+def _apply_plan_to_file(plan_json: str, sdfg_path: str, output_path: str) -> str:
+    # Runs in a worker process, which imports dace here
+    import dace
+    sdfg = dace.SDFG.from_file(sdfg_path)
+    TransformationPlan.from_json(plan_json).apply(sdfg)
+    sdfg.save(output_path)
+    return output_path
+
+
+def dispatch(plan: Union[TransformationPlan, str],
+             jobs: Sequence[Tuple[str, str]],
+             max_workers: Optional[int] = None) -> List[str]:
+    """
+    Applies a plan to SDFG files in worker processes. The plan is validated before any worker is started, the
+    calling process does not import dace.
+
+    :param plan: The plan or its JSON form.
+    :param jobs: Pairs of input and output SDFG paths.
+    :return: The output paths, in the order of the jobs.
+    """
+    if isinstance(plan, str):
+        plan = TransformationPlan.from_json(plan)
+    plan.validate()
+    plan_json = plan.to_json()
+
+    # Only needed for dispatching, not for parsing and validating plans
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        futures = [executor.submit(_apply_plan_to_file, plan_json, sdfg_path, output_path)
+                   for sdfg_path, output_path in jobs]
+        return [future.result() for future in futures]
@@ -0,0 +1,75 @@
+import importlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Tuple
+
+# This module must not import dace (directly or through other modules of the package): it is used to look up, check
+# and dispatch transformations in processes that might never apply one.
+
+
+@dataclass(frozen=True)
+class TransformationSpec:
+    name: str
+    module: str
+    # "pass" for ppl.Pass subclasses (applied with apply_pass), "transformation" for pattern transformations
+    kind: str
+    required_options: Tuple[str, ...] = ()
+    optional_options: Tuple[str, ...] = ()
+    # Options given as the name of a member of an enum in dace.dtypes, option -> enum name
+    enum_options: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def options(self) -> Tuple[str, ...]:
+        return self.required_options + self.optional_options
+
+    def load(self) -> type:
+        """ Imports the module of the transformation (and with it dace) and returns the class. """
+        return getattr(importlib.import_module(self.module), self.name)
+
+    def convert_options(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """ Converts plain (e.g. JSON) option values to the values the class expects. Imports dace if needed. """
+        converted = dict(options)
+        for option, enum_name in self.enum_options.items():
+            if isinstance(converted.get(option), str):
+                dtypes = importlib.import_module("dace.dtypes")
+                converted[option] = getattr(dtypes, enum_name)[converted[option]]
+        return converted
+
+
+REGISTRY: Dict[str, TransformationSpec] = {
+    spec.name: spec
+    for spec in (
+        TransformationSpec(name="PermuteArrayDimensions",
+                           module="layout_and_schedule_transformations.permute_array_dimensions",
+                           kind="pass",
+                           required_options=("permute_map", "add_permute_maps"),
+                           optional_options=("first_touch", "memory_budget", "budget_symbols", "slab_size",
+                                             "slab_dim")),
+        TransformationSpec(name="PermuteMapDimensions",
+                           module="layout_and_schedule_transformations.permute_map_dimensions",
+                           kind="pass",
+                           required_options=("permute_map", "use_labels")),
+        TransformationSpec(name="DoubleBuffering",
+                           module="layout_and_schedule_transformations.double_buffering",
+                           kind="transformation",
+                           optional_options=("device_map_type", "copy_src_type", "copy_dst_type", "memory_budget",
+                                             "budget_symbols"),
+                           enum_options={
+                               "device_map_type": "ScheduleType",
+                               "copy_src_type": "StorageType",
+                               "copy_dst_type": "StorageType",
+                           }),
+        TransformationSpec(name="EmptyTransformation",
+                           module="layout_and_schedule_transformations.empty_transformation",
+                           kind="transformation"),
+    )
+}
+
+
+def get_spec(name: str) -> TransformationSpec:
+    if name not in REGISTRY:
+        raise KeyError(f"Unknown transformation {name}, known transformations are {sorted(REGISTRY)}")
+    return REGISTRY[name]
+
+
+def load(name: str) -> type:
+    return get_spec(name).load()
@@ -0,0 +1,210 @@
+import dace
+import re
+from typing import Dict, List, Any, Optional, Tuple, Union
+from dace.transformation.dataflow.map_collapse import MapCollapse
+from dace.transformation.dataflow.map_dim_shuffle import MapDimShuffle
+from dace.transformation.dataflow.strip_mining import StripMining
+from dace.transformation.dataflow.tiling import MapTiling
+from dace.transformation import pass_pipeline as ppl
+from dataclasses import dataclass, field
+
+
+@dataclass
+class MapSchedule:
+    """
+    Declarative schedule of one map. The steps are applied in a fixed order:
+
+    1. ``collapse``: merge the directly nested map into this one (its parameters are appended).
+    2. ``permute``: reorder the parameters, same semantics as ``PermuteMapDimensions``
+       (``new_params[j] = old_params[permute[j]]``).
+    3. ``strip_mine``: split each given parameter into a separate outer map iterating over tiles of the given size.
+    4. ``tile``: split the given parameters into tiles, the tile loops form a single outer map.
+    5. ``parallelize``: make the ``"outer"`` or ``"inner"`` map of the resulting nest ``CPU_Multicore`` and the
+       rest of the nest ``Sequential``.
+
+    A schedule can also be written as a string, e.g. ``"permute [0,2,1], tile k by 32, parallelize outer"``, see
+    ``from_string``.
+    """
+    permute: Optional[List[int]] = None
+    tile: Dict[str, int] = field(default_factory=dict)
+    strip_mine: Dict[str, int] = field(default_factory=dict)
+    collapse: bool = False
+    parallelize: Optional[str] = None
+
+    _CLAUSES = (
+        (re.compile(r"permute\s*\[([\d\s,]*)\]"), "permute"),
+        (re.compile(r"tile\s+(\w+)\s+by\s+(\d+)"), "tile"),
+        (re.compile(r"strip[-_ ]?mine\s+(\w+)\s+by\s+(\d+)"), "strip_mine"),
+        (re.compile(r"collapse"), "collapse"),
+        (re.compile(r"parallelize\s+(\w+)"), "parallelize"),
+    )
+
+    @classmethod
+    def from_string(cls, spec: str) -> 'MapSchedule':
+        """
+        Parses a comma-separated list of clauses: ``permute [i, j, ...]``, ``tile <param> by <size>``,
+        ``strip-mine <param> by <size>``, ``collapse`` and ``parallelize outer|inner``.
+        """
+        schedule = cls()
+        for clause in cls._split_clauses(spec):
+            for pattern, kind in cls._CLAUSES:
+                match = pattern.fullmatch(clause)
+                if match is None:
+                    continue
+                if kind == "permute":
+                    schedule.permute = [int(i) for i in match.group(1).split(",") if i.strip()]
+                elif kind == "tile":
+                    schedule.tile[match.group(1)] = int(match.group(2))
+                elif kind == "strip_mine":
+                    schedule.strip_mine[match.group(1)] = int(match.group(2))
+                elif kind == "collapse":
+                    schedule.collapse = True
+                else:
+                    schedule.parallelize = match.group(1)
+                break
+            else:
+                raise ValueError(f"Unknown schedule clause '{clause}' in '{spec}'")
+        return schedule
+
+    @staticmethod
+    def _split_clauses(spec: str) -> List[str]:
+        # Split on commas that are not within the brackets of a permutation
+        clauses = []
+        depth = 0
+        current = ""
+        for char in spec:
+            if char == "[":
+                depth += 1
+            elif char == "]":
+                depth -= 1
+            if char == "," and depth == 0:
+                clauses.append(current.strip())
+                current = ""
+            else:
+                current += char
+        clauses.append(current.strip())
+        return [c for c in clauses if c]
+
+    def validate(self, state: dace.SDFGState, map_entry: dace.nodes.MapEntry) -> None:
+        """ Raises a ``ValueError`` if the schedule cannot be legally applied to the given map. """
+        label = map_entry.map.label
+        params = list(map_entry.map.params)
+
+        if self.collapse:
+            inner_map_entry = _directly_nested_map(state, map_entry)
+            if inner_map_entry is None:
+                raise ValueError(f"Cannot collapse map {label}: it does not directly contain exactly one map")
+            if not MapCollapse.can_be_applied_to(state.sdfg, outer_map_entry=map_entry,
+                                                 inner_map_entry=inner_map_entry):
+                raise ValueError(f"Cannot collapse map {label} with {inner_map_entry.map.label}: the inner range "
+                                 f"depends on the outer parameters, the schedules differ or there are nodes "
+                                 f"between the maps")
+            params += inner_map_entry.map.params
+
+        if self.permute is not None and sorted(self.permute) != list(range(len(params))):
+            raise ValueError(f"Permutation {self.permute} of map {label} is not a permutation of its "
+                             f"{len(params)} parameters {params}")
+
+        for kind, sizes in (("tile", self.tile), ("strip-mine", self.strip_mine)):
+            for param, size in sizes.items():
+                if param not in params:
+                    raise ValueError(f"Cannot {kind} unknown parameter {param} of map {label} with parameters "
+                                     f"{params}")
+                if not isinstance(size, int) or size <= 0:
+                    raise ValueError(f"The {kind} size of {param} of map {label} must be a positive integer, got "
+                                     f"{size}")
+        both = set(self.tile) & set(self.strip_mine)
+        if both:
+            raise ValueError(f"Parameters {sorted(both)} of map {label} are both tiled and strip-mined")
+
+        if self.parallelize is not None:
+            if self.parallelize not in ("outer", "inner"):
+                raise ValueError(f"Cannot parallelize '{self.parallelize}' of map {label}, expected 'outer' or "
+                                 f"'inner'")
+            if map_entry.map.schedule in dace.dtypes.GPU_SCHEDULES:
+                raise ValueError(f"Cannot parallelize GPU map {label} on the CPU")
+
+
+def _directly_nested_map(state: dace.SDFGState, map_entry: dace.nodes.MapEntry) -> Optional[dace.nodes.MapEntry]:
+    children = state.scope_children()[map_entry]
+    inner_entries = [n for n in children if isinstance(n, dace.nodes.MapEntry)]
+    if len(inner_entries) != 1:
+        return None
+    return inner_entries[0]
+
+
+@dataclass(eq=False)
+class ScheduleMapNests(ppl.Pass):
+    def modifies(self) -> ppl.Modifies:
+        return ppl.Modifies.Nodes | ppl.Modifies.Memlets | ppl.Modifies.Symbols
+
+    def should_reapply(self, modified: ppl.Modifies) -> bool:
+        return False
+
+    def __init__(self,
+                 schedules: Dict[str, Union[MapSchedule, str]]):
+        self._schedules = {
+            label: MapSchedule.from_string(schedule) if isinstance(schedule, str) else schedule
+            for label, schedule in schedules.items()
+        }
+
+    def apply_pass(self, sdfg: dace.SDFG, pipeline_results: Dict[str, Any]) -> int:
+        # Validate every schedule before modifying anything
+        targets = self._find_maps(sdfg)
+        for state, map_entry in targets:
+            self._schedules[map_entry.map.label].validate(state, map_entry)
+
+        for state, map_entry in targets:
+            self._apply_schedule(state, map_entry, self._schedules[map_entry.map.label])
+        return 0
+
+    def _find_maps(self, sdfg: dace.SDFG) -> List[Tuple[dace.SDFGState, dace.nodes.MapEntry]]:
+        targets = []
+        found_labels = set()
+        for node, state in sdfg.all_nodes_recursive():
+            if isinstance(node, dace.nodes.MapEntry) and node.map.label in self._schedules:
+                targets.append((state, node))
+                found_labels.add(node.map.label)
+        missing_labels = set(self._schedules) - found_labels
+        if missing_labels:
+            raise ValueError(f"No maps with labels {sorted(missing_labels)} in SDFG {sdfg.name}")
+        return targets
+
+    def _apply_schedule(self, state: dace.SDFGState, map_entry: dace.nodes.MapEntry, schedule: MapSchedule):
+        sdfg = state.sdfg
+        parent = state.scope_dict()[map_entry]
+
+        if schedule.collapse:
+            inner_map_entry = _directly_nested_map(state, map_entry)
+            map_entry, _ = MapCollapse.apply_to(sdfg, outer_map_entry=map_entry, inner_map_entry=inner_map_entry)
+
+        if schedule.permute is not None:
+            old_params = map_entry.map.params
+            new_params = [old_params[i] for i in schedule.permute]
+            MapDimShuffle.apply_to(sdfg, map_entry=map_entry, options={"parameters": new_params})
+
+        # Strip-mining and tiling keep map_entry as the innermost map of the nest
+        for param, size in schedule.strip_mine.items():
+            StripMining.apply_to(sdfg,
+                                 map_entry=map_entry,
+                                 options={
+                                     "dim_idx": map_entry.map.params.index(param),
+                                     "tile_size": str(size),
+                                     "new_dim_prefix": "tile",
+                                 })
+
+        if schedule.tile:
+            sizes = map_entry.map.range.size()
+            # Tiling a dimension with its full size skips it
+            tile_sizes = [schedule.tile.get(p, sizes[i]) for i, p in enumerate(map_entry.map.params)]
+            MapTiling.apply_to(sdfg, map_entry=map_entry, options={"tile_sizes": tile_sizes, "prefix": "tile"})
+
+        if schedule.parallelize is not None:
+            nest = [map_entry]
+            scope_dict = state.scope_dict()
+            while scope_dict[nest[0]] is not parent:
+                nest.insert(0, scope_dict[nest[0]])
+            parallel_map = nest[0] if schedule.parallelize == "outer" else nest[-1]
+            for entry in nest:
+                entry.map.schedule = (dace.dtypes.ScheduleType.CPU_Multicore
+                                      if entry is parallel_map else dace.dtypes.ScheduleType.Sequential)
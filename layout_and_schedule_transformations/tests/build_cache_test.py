@@ -0,0 +1,111 @@
+import copy
+import numpy as np
+import dace
+
+from layout_and_schedule_transformations.build_cache import BuildCache
+from layout_and_schedule_transformations.permute_map_dimensions import PermuteMapDimensions
+
+N = dace.symbol("N", dtype=dace.int64)
+
+
+@dace.program
+def scale(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        with dace.tasklet:
+            a << A[j, i]
+            b >> B[j, i]
+            b = 2.0 * a
+
+
+def _transformed(sdfg: dace.SDFG) -> dace.SDFG:
+    transformed_sdfg = copy.deepcopy(sdfg)
+    transformed_sdfg.name = sdfg.name + "_transposed"
+    map_labels = {n.map.label: [1, 0] for n, _ in transformed_sdfg.all_nodes_recursive()
+                  if isinstance(n, dace.nodes.MapEntry)}
+    PermuteMapDimensions(permute_map=map_labels, use_labels=True).apply_pass(transformed_sdfg, {})
+    return transformed_sdfg
+
+
+def test_reuse_builds(tmp_path):
+    cache = BuildCache(cache_dir=str(tmp_path))
+    original_sdfg = scale.to_sdfg(simplify=True)
+    transformed_sdfg = _transformed(original_sdfg)
+
+    cache.compile(original_sdfg)
+    cache.compile(transformed_sdfg)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    # Identical variants built again from scratch hit the cache
+    compiled_original = cache.compile(copy.deepcopy(original_sdfg))
+    compiled_transformed = cache.compile(_transformed(scale.to_sdfg(simplify=True)))
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    A = np.random.rand(8, 8)
+    B_orig = np.zeros_like(A)
+    B_trans = np.zeros_like(A)
+    compiled_original(A=A, B=B_orig, N=8)
+    compiled_transformed(A=A, B=B_trans, N=8)
+    assert np.allclose(B_orig, 2.0 * A)
+    assert np.allclose(B_trans, 2.0 * A)
+
+
+def test_compiler_flags_are_part_of_the_key(tmp_path):
+    cache = BuildCache(cache_dir=str(tmp_path))
+    sdfg = scale.to_sdfg(simplify=True)
+    key = cache.key(sdfg)
+
+    # Any compiler setting that changes the generated code or the build changes the key
+    for config_key, new_value in (
+        (("compiler", "cpu", "args"), dace.Config.get("compiler", "cpu", "args") + " -DBUILD_CACHE_TEST"),
+        (("compiler", "cuda", "default_block_size"), "64,2,1"),
+        (("compiler", "max_stack_array_size"), 1024),
+    ):
+        old_value = dace.Config.get(*config_key)
+        try:
+            dace.Config.set(*config_key, value=new_value)
+            assert cache.key(sdfg) != key, config_key
+        finally:
+            dace.Config.set(*config_key, value=old_value)
+        assert cache.key(sdfg) == key
+
+
+def test_instrumentation_is_part_of_the_key(tmp_path):
+    cache = BuildCache(cache_dir=str(tmp_path))
+    sdfg = scale.to_sdfg(simplify=True)
+    key = cache.key(sdfg)
+
+    # Instrumented and plain builds must not be mixed up, e.g. when timing variants
+    timed_sdfg = copy.deepcopy(sdfg)
+    timed_sdfg.instrument = dace.dtypes.InstrumentationType.Timer
+    assert cache.key(timed_sdfg) != key
+
+    timed_sdfg = copy.deepcopy(sdfg)
+    [map_entry] = [n for n, _ in timed_sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]
+    map_entry.map.instrument = dace.dtypes.InstrumentationType.Timer
+    assert cache.key(timed_sdfg) != key
+    map_entry.map.instrument = dace.dtypes.InstrumentationType.No_Instrumentation
+    assert cache.key(timed_sdfg) == key
+
+
+def test_lru_eviction(tmp_path):
+    cache = BuildCache(cache_dir=str(tmp_path))
+    original_sdfg = scale.to_sdfg(simplify=True)
+    transformed_sdfg = _transformed(original_sdfg)
+
+    cache.compile(original_sdfg)
+    entry_size = cache.size()
+
+    # Only one entry fits, the least recently used one is evicted
+    cache.max_size = entry_size + entry_size // 2
+    cache.compile(transformed_sdfg)
+    assert cache.contains(transformed_sdfg)
+    assert not cache.contains(original_sdfg)
+    assert cache.size() <= cache.max_size
+
+
+if __name__ == "__main__":
+    import tempfile
+    for test in (test_reuse_builds, test_compiler_flags_are_part_of_the_key, test_instrumentation_is_part_of_the_key,
+                 test_lru_eviction):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test(tmp_dir)
@@ -0,0 +1,96 @@
+import dace
+import pytest
+
+from layout_and_schedule_transformations.cache_simulator import CacheHierarchy, CacheLevel, simulate_cache
+
+N = dace.symbol("N", dtype=dace.int64)
+
+
+@dace.program
+def column_sum(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        B[j, i] = A[j, i] + 1.0
+
+
+@dace.program
+def row_copy(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        B[i, j] = A[i, j]
+
+
+@dace.program
+def gather(vals_A: dace.float64[N, N, N], vals_B: dace.float64[N, N, N], neighbors: dace.int64[N, N, 4]):
+    for i, j, k in dace.map[0:N - 2, 0:N - 2, 0:N - 2]:
+        vals_B[i + 1, j + 1, k + 1] = 0.5 * (vals_A[i + 1, j + 1, k + 1]
+                                             + vals_A[neighbors[i + 1, k + 1, 0], j + 1, neighbors[i + 1, k + 1, 2]])
+
+
+def test_cache_hierarchy_lru():
+    cache = CacheHierarchy([CacheLevel("L1", size=2 * 64, line_size=64, associativity=2)])
+    # Two lines fit, the third evicts the least recently used one
+    assert cache.access(0) == 1
+    assert cache.access(64) == 1
+    assert cache.access(8) == 0
+    assert cache.access(128) == 1
+    assert cache.access(0) == 0
+    assert cache.access(64) == 1
+
+
+def test_permuted_layout_reduces_misses():
+    sdfg = column_sum.to_sdfg(simplify=True)
+    levels = [CacheLevel("L1", size=4 * 1024, line_size=64, associativity=4)]
+    symbols = {"N": 64}
+
+    original = simulate_cache(sdfg, symbols, levels=levels)
+    transposed = simulate_cache(sdfg, symbols, levels=levels, permute_map={"A": [1, 0], "B": [1, 0]})
+    interchanged = simulate_cache(sdfg, symbols, levels=levels,
+                                  map_permute_map={label: [1, 0] for label in original.map_accesses})
+
+    assert original.total_accesses() == 2 * 64 * 64
+    assert transposed.total_accesses() == original.total_accesses()
+    assert transposed.total_misses() < original.total_misses()
+    assert interchanged.total_misses() < original.total_misses()
+    assert set(original.array_misses["L1"]) == {"A", "B"}
+
+
+def test_sampling_is_deterministic():
+    sdfg = column_sum.to_sdfg(simplify=True)
+    first = simulate_cache(sdfg, {"N": 32}, sample_every=4)
+    second = simulate_cache(sdfg, {"N": 32}, sample_every=4)
+    assert first.total_accesses() == 2 * 8 * 32
+    assert dict(first.array_misses["L1"]) == dict(second.array_misses["L1"])
+
+
+def test_sampling_keeps_miss_rate():
+    sdfg = row_copy.to_sdfg(simplify=True)
+    full = simulate_cache(sdfg, {"N": 64})
+    sampled = simulate_cache(sdfg, {"N": 64}, sample_every=8)
+    assert sampled.total_accesses() == full.total_accesses() // 8
+    # One miss per 64-byte line of doubles
+    assert full.miss_rate("L1") == pytest.approx(0.125)
+    assert sampled.miss_rate("L1") == pytest.approx(full.miss_rate("L1"))
+
+
+def test_indirect_accesses():
+    sdfg = gather.to_sdfg(simplify=True)
+    result = simulate_cache(sdfg, {"N": 10})
+    # One direct and one indirect read of vals_A per iteration, not the whole array per indirect read
+    assert result.array_accesses["vals_B"] == 8**3
+    assert result.array_accesses["vals_A"] == 2 * 8**3
+    assert result.indirect_accesses["vals_A"] == 8**3
+    assert "vals_B" not in result.indirect_accesses
+
+
+def test_invalid_permutation():
+    sdfg = column_sum.to_sdfg(simplify=True)
+    with pytest.raises(ValueError):
+        simulate_cache(sdfg, {"N": 8}, permute_map={"A": [0, 0]})
+
+
+if __name__ == "__main__":
+    test_cache_hierarchy_lru()
+    test_permuted_layout_reduces_misses()
+    test_sampling_is_deterministic()
+    test_sampling_keeps_miss_rate()
+    test_indirect_accesses()
+    test_invalid_permutation()
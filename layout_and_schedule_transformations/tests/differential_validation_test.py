@@ -0,0 +1,78 @@
+import dace
+import numpy as np
+
+from layout_and_schedule_transformations.differential_validation import generate_inputs, validate_transformation
+from layout_and_schedule_transformations.permute_array_dimensions import PermuteArrayDimensions
+from layout_and_schedule_transformations.permute_map_dimensions import PermuteMapDimensions
+
+N = dace.symbol("N", dtype=dace.int64)
+
+
+@dace.program
+def kernel(vals_A: dace.float64[N, N, N], vals_B: dace.float64[N, N, N], neighbors: dace.int64[N, N, 4]):
+    for i, j, k in dace.map[0:N - 2, 0:N - 2, 0:N - 2]:
+        vals_B[i + 1, j + 1, k + 1] = 0.25 * (
+            vals_A[i + 1, j + 1, k + 1]
+            + vals_A[i + 1, j, k + 1]
+            + vals_A[neighbors[i + 1, k + 1, 0], j + 1, neighbors[i + 1, k + 1, 2]]
+            + vals_A[neighbors[i + 1, k + 1, 1], j + 1, neighbors[i + 1, k + 1, 3]]
+        )
+
+
+def _permute_maps(sdfg: dace.SDFG):
+    map_labels = {n.map.label: [0, 2, 1] for n, _ in sdfg.all_nodes_recursive()
+                  if isinstance(n, dace.nodes.MapEntry) and len(n.map.params) == 3}
+    PermuteMapDimensions(permute_map=map_labels, use_labels=True).apply_pass(sdfg, {})
+
+
+def _change_tasklets(sdfg: dace.SDFG):
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, dace.nodes.Tasklet) and "0.25" in node.code.as_string:
+            node.code.as_string = node.code.as_string.replace("0.25", "0.5")
+
+
+def test_generate_inputs():
+    sdfg = kernel.to_sdfg(simplify=True)
+    inputs = generate_inputs(sdfg, {"N": 6}, index_ranges={"neighbors": (1, 5)})
+    assert inputs["vals_A"].shape == (6, 6, 6)
+    assert inputs["vals_A"].dtype == np.float64
+    assert inputs["neighbors"].dtype == np.int64
+    assert inputs["neighbors"].min() >= 1 and inputs["neighbors"].max() < 5
+
+    # Without a range, integers are valid indices into every dimension
+    inputs = generate_inputs(sdfg, {"N": 6})
+    assert inputs["neighbors"].min() >= 0 and inputs["neighbors"].max() < 4
+
+
+def test_validate_permutation():
+    dace.Config.set('cache', value='unique')
+    sdfg = kernel.to_sdfg(simplify=True)
+    plan = [
+        PermuteArrayDimensions(permute_map={"vals_A": [0, 2, 1], "vals_B": [0, 2, 1]}, add_permute_maps=True),
+        _permute_maps,
+    ]
+
+    result = validate_transformation(sdfg, plan, symbols={"N": 8}, index_ranges={"neighbors": (0, 8)}, repetitions=2)
+    assert result.passed
+    assert set(result.max_abs_error) == {"vals_A", "vals_B", "neighbors"}
+    assert max(result.max_abs_error.values()) < 1e-12
+    assert result.original_time > 0 and result.transformed_time > 0
+    assert result.speedup > 0
+
+
+def test_detect_mismatch():
+    dace.Config.set('cache', value='unique')
+    sdfg = kernel.to_sdfg(simplify=True)
+
+    result = validate_transformation(sdfg, [_change_tasklets], symbols={"N": 8}, index_ranges={"neighbors": (0, 8)},
+                                     parallel=False)
+    assert not result.passed
+    assert result.mismatched == ["vals_B"]
+    assert result.max_abs_error["vals_B"] > 0
+    assert result.max_abs_error["vals_A"] == 0
+
+
+if __name__ == "__main__":
+    test_generate_inputs()
+    test_validate_permutation()
+    test_detect_mismatch()
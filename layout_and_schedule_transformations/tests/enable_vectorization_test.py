@@ -0,0 +1,106 @@
+import copy
+import numpy as np
+import dace
+
+from layout_and_schedule_transformations.enable_vectorization import EnableVectorization, map_id
+from layout_and_schedule_transformations.permute_array_dimensions import PermuteArrayDimensions
+
+N = 32
+
+
+@dace.program
+def row_scale(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        with dace.tasklet:
+            a << A[i, j]
+            b >> B[i, j]
+            b = 2.0 * a
+
+
+@dace.program
+def column_scale(A: dace.float64[N, N], B: dace.float64[N, N]):
+    # The last three columns are not touched, leaving a remainder after vectorization
+    for i, j in dace.map[0:N, 0:N - 3]:
+        with dace.tasklet:
+            a << A[j, i]
+            b >> B[j, i]
+            b = 2.0 * a
+
+
+@dace.program
+def column_reduce(A: dace.float64[N, N], s: dace.float64[N]):
+    for i, j in dace.map[0:N, 0:N]:
+        with dace.tasklet:
+            a << A[i, j]
+            out >> s(1, lambda x, y: x + y)[i]
+            out = a
+
+
+def _map_ids(sdfg: dace.SDFG):
+    return [map_id(state, n) for n, state in sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]
+
+
+def test_alignment_of_arguments():
+    sdfg = row_scale.to_sdfg(simplify=True)
+    [node_id] = _map_ids(sdfg)
+
+    # Arrays are only known to be aligned to 16 bytes, i.e., two doubles
+    report = EnableVectorization(vector_len=4, vectorize=False).apply_pass(sdfg, {})
+    assert "not guaranteed to be aligned" in report.rejected[node_id]
+    report = EnableVectorization(vector_len=4, vectorize=False, assumed_alignment=32).apply_pass(sdfg, {})
+    assert report.vectorized == [node_id]
+    report = EnableVectorization(vector_len=2, vectorize=False).apply_pass(sdfg, {})
+    assert report.vectorized == [node_id]
+
+
+def test_report_before_and_after_permutation():
+    sdfg = column_scale.to_sdfg(simplify=True)
+    [node_id] = _map_ids(sdfg)
+
+    report = EnableVectorization(vector_len=2, vectorize=False).apply_pass(sdfg, {})
+    assert report.vectorized == []
+    assert "non-contiguous access" in report.rejected[node_id]
+
+    label = report.labels[node_id]
+    PermuteArrayDimensions(permute_map={"A": [1, 0], "B": [1, 0]}, add_permute_maps=True).apply_pass(sdfg, {})
+    report = EnableVectorization(vector_len=2, vectorize=False).apply_pass(sdfg, {})
+    assert [report.labels[i] for i in report.vectorized] == [label]
+    # The copies between the layouts transpose, they can never be vectorized. They share one label, but every
+    # copy is reported.
+    copy_ids = [i for i, label in report.labels.items() if label == "permute_impl"]
+    assert len(copy_ids) == 4
+    assert all("non-contiguous access" in report.rejected[i] for i in copy_ids)
+
+
+def test_write_conflicts_are_rejected():
+    sdfg = column_reduce.to_sdfg(simplify=True)
+    [node_id] = _map_ids(sdfg)
+    report = EnableVectorization(vector_len=2, vectorize=False).apply_pass(sdfg, {})
+    assert "write conflict" in report.rejected[node_id]
+
+
+def test_vectorized_results_match():
+    dace.Config.set('cache', value='unique')
+
+    original_sdfg = column_scale.to_sdfg(simplify=True)
+    transformed_sdfg = copy.deepcopy(original_sdfg)
+    transformed_sdfg.name = original_sdfg.name + "_vectorized"
+    PermuteArrayDimensions(permute_map={"A": [1, 0], "B": [1, 0]},
+                           add_permute_maps=True).apply_pass(transformed_sdfg, {})
+    report = EnableVectorization(vector_len=2).apply_pass(transformed_sdfg, {})
+    assert len(report.vectorized) == 1
+    transformed_sdfg.validate()
+
+    A = np.random.rand(N, N)
+    B_orig = np.zeros((N, N))
+    B_trans = np.zeros((N, N))
+    original_sdfg(A=A, B=B_orig)
+    transformed_sdfg(A=A.copy(), B=B_trans)
+    assert np.allclose(B_orig, B_trans)
+
+
+if __name__ == "__main__":
+    test_alignment_of_arguments()
+    test_report_before_and_after_permutation()
+    test_write_conflicts_are_rejected()
+    test_vectorized_results_match()
@@ -0,0 +1,153 @@
+import copy
+import dace
+import pytest
+from typing import List
+
+from layout_and_schedule_transformations import kernel_analysis
+from layout_and_schedule_transformations.kernel_analysis import (KernelScopeAnalysis, invalidate_kernel_scopes,
+                                                                 kernel_scope)
+from layout_and_schedule_transformations.tests.test_utils import _add_shared_memory
+
+N = dace.symbol("N", dtype=dace.int64)
+
+
+@dace.program
+def kernel(
+    A: dace.float64[N] @ dace.dtypes.StorageType.GPU_Global,
+    B: dace.float64[N] @ dace.dtypes.StorageType.GPU_Global,
+    C: dace.float64[N] @ dace.dtypes.StorageType.GPU_Global,
+):
+    for i in dace.map[0:N:256] @ dace.dtypes.ScheduleType.GPU_Device:
+        for j in dace.map[0:256] @ dace.dtypes.ScheduleType.GPU_ThreadBlock:
+            C[i + j] = A[i + j] + B[i + j]
+
+
+def _device_maps(sdfg: dace.SDFG):
+    return [
+        node for state in sdfg.all_states() for node in state.nodes()
+        if isinstance(node, dace.nodes.MapEntry) and node.map.schedule == dace.dtypes.ScheduleType.GPU_Device
+    ]
+
+
+def test_kernel_scope_analysis():
+    original_sdfg = kernel.to_sdfg(simplify=True)
+    transformed_sdfg = copy.deepcopy(original_sdfg)
+    _add_shared_memory(transformed_sdfg, add_src_access_node=True)
+    transformed_sdfg.validate()
+
+    storage_pair = (dace.dtypes.StorageType.GPU_Global, dace.dtypes.StorageType.GPU_Shared)
+
+    original_kernels = KernelScopeAnalysis().apply_pass(original_sdfg, {})
+    [device_map] = _device_maps(original_sdfg)
+    assert len(original_kernels[device_map].staged_copies.get(storage_pair, [])) == 0
+
+    transformed_kernels = KernelScopeAnalysis().apply_pass(transformed_sdfg, {})
+    [device_map] = _device_maps(transformed_sdfg)
+    kernel_scope = transformed_kernels[device_map]
+    state = kernel_scope.state
+
+    # Same contents as the scope the matchers used to rescan for every candidate
+    kernel_nodes = state.all_nodes_between(device_map, state.exit_node(device_map))
+    assert kernel_scope.nodes == set(kernel_nodes)
+    assert set(kernel_scope.edges) == set(state.all_edges(*kernel_nodes))
+    assert {e.dst.data for e in kernel_scope.staged_copies[storage_pair]} == {"shr_A", "shr_B"}
+    assert set(kernel_scope.footprint) == {"A", "B", "C"}
+    assert not kernel_scope.is_stale(device_map)
+
+    state.add_access("A")
+    assert kernel_scope.is_stale(device_map)
+
+
+def _staged_kernels(num_kernels: int) -> dace.SDFG:
+    # One state with independent kernels, each staging its input through shared memory
+    sdfg = dace.SDFG(f"staged_kernels_{num_kernels}")
+    state = sdfg.add_state()
+    for k in range(num_kernels):
+        sdfg.add_array(f"A{k}", [256], dace.float64, storage=dace.dtypes.StorageType.GPU_Global)
+        sdfg.add_array(f"C{k}", [256], dace.float64, storage=dace.dtypes.StorageType.GPU_Global)
+        sdfg.add_array(f"shr_A{k}", [256], dace.float64, storage=dace.dtypes.StorageType.GPU_Shared, transient=True)
+        device_entry, device_exit = state.add_map(f"kernel_{k}", {"b": "0:1"},
+                                                  schedule=dace.dtypes.ScheduleType.GPU_Device)
+        block_entry, block_exit = state.add_map(f"block_{k}", {"t": "0:256"},
+                                                schedule=dace.dtypes.ScheduleType.GPU_ThreadBlock)
+        tasklet = state.add_tasklet(f"scale_{k}", {"a"}, {"c"}, "c = 2.0 * a")
+        src, staged = state.add_access(f"A{k}"), state.add_access(f"shr_A{k}")
+        state.add_memlet_path(state.add_access(f"A{k}"), device_entry, src, memlet=dace.Memlet(f"A{k}[0:256]"))
+        state.add_nedge(src, staged, dace.Memlet(f"A{k}[0:256]"))
+        state.add_memlet_path(staged, block_entry, tasklet, dst_conn="a", memlet=dace.Memlet(f"shr_A{k}[t]"))
+        state.add_memlet_path(tasklet, block_exit, device_exit, state.add_access(f"C{k}"), src_conn="c",
+                              memlet=dace.Memlet(f"C{k}[t]"))
+    sdfg.validate()
+    return sdfg
+
+
+def _count_sweeps(monkeypatch) -> List[int]:
+    sweeps = [0]
+    analyze = kernel_analysis.analyze_state
+
+    def counting_analyze_state(state):
+        sweeps[0] += 1
+        return analyze(state)
+
+    monkeypatch.setattr(kernel_analysis, "analyze_state", counting_analyze_state)
+    return sweeps
+
+
+def test_shared_kernel_scopes(monkeypatch):
+    sdfg = _staged_kernels(4)
+    sweeps = _count_sweeps(monkeypatch)
+    storage_pair = (dace.dtypes.StorageType.GPU_Global, dace.dtypes.StorageType.GPU_Shared)
+
+    # Every lookup reuses the analysis of the root SDFG
+    scopes = {entry: kernel_scope(state, entry) for entry, state in sdfg.all_nodes_recursive()
+              if isinstance(entry, dace.nodes.MapEntry) and entry.map.schedule in dace.dtypes.GPU_SCHEDULES}
+    assert sweeps[0] == 1
+    assert all(len(scope.staged_copies[storage_pair]) == (1 if entry.map.label.startswith("kernel") else 0)
+               for entry, scope in scopes.items())
+
+    # Adding or removing nodes and edges invalidates the state, without rescanning it on every lookup
+    [device_map] = [e for e in scopes if e.map.label == "kernel_0"]
+    state = scopes[device_map].state
+    [copy_edge] = scopes[device_map].staged_copies[storage_pair]
+    state.remove_edge(copy_edge)
+    state.add_edge(copy_edge.src, None, copy_edge.dst, None, dace.Memlet(data=copy_edge.data.data,
+                                                                         subset=copy_edge.data.subset))
+    assert scopes[device_map].is_stale(device_map)
+    assert kernel_scope(state, device_map) is not scopes[device_map]
+    assert sweeps[0] == 2
+
+    # Other changes are picked up once the analysis is invalidated (or re-run by a pipeline)
+    sdfg.arrays["shr_A0"].storage = dace.dtypes.StorageType.Register
+    assert len(kernel_scope(state, device_map).staged_copies[storage_pair]) == 1
+    invalidate_kernel_scopes(sdfg)
+    assert len(kernel_scope(state, device_map).staged_copies[storage_pair]) == 0
+
+    # Running the analysis, as a pipeline does after passes that modify nodes, memlets or descriptors, refreshes it
+    sdfg.arrays["shr_A0"].storage = dace.dtypes.StorageType.GPU_Shared
+    KernelScopeAnalysis().apply_pass(sdfg, {})
+    assert len(kernel_scope(state, device_map).staged_copies[storage_pair]) == 1
+
+
+def test_matching_sweeps_once(monkeypatch):
+    from dace.transformation.passes.pattern_matching import match_patterns
+    from layout_and_schedule_transformations.double_buffering import DoubleBuffering
+
+    options = {
+        "device_map_type": dace.dtypes.ScheduleType.GPU_Device,
+        "copy_src_type": dace.dtypes.StorageType.GPU_Global,
+        "copy_dst_type": dace.dtypes.StorageType.GPU_Shared,
+    }
+    sweeps = _count_sweeps(monkeypatch)
+    for num_kernels in (10, 40):
+        sweeps[0] = 0
+        sdfg = _staged_kernels(num_kernels)
+        # The matcher creates a new DoubleBuffering per candidate, all of them share one sweep of the state
+        matches = list(match_patterns(sdfg, DoubleBuffering, options=[options]))
+        assert len(matches) == num_kernels
+        assert sweeps[0] == 1
+
+
+if __name__ == "__main__":
+    test_kernel_scope_analysis()
+    test_shared_kernel_scopes(pytest.MonkeyPatch())
+    test_matching_sweeps_once(pytest.MonkeyPatch())
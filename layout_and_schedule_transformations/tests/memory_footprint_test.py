@@ -0,0 +1,184 @@
+import copy
+import dace
+import numpy as np
+import pytest
+import warnings
+from dace.transformation import pass_pipeline as ppl
+from dataclasses import dataclass
+
+from layout_and_schedule_transformations.memory_footprint import (MemoryFootprintAnalysis, footprint_before_after,
+                                                                  memory_footprint)
+from layout_and_schedule_transformations.permute_array_dimensions import PermuteArrayDimensions
+from layout_and_schedule_transformations.tests.test_utils import _add_shared_memory
+
+M = dace.symbol("M", dtype=dace.int64)
+N = dace.symbol("N", dtype=dace.int64)
+
+
+@dace.program
+def scale(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        with dace.tasklet:
+            a << A[j, i]
+            b >> B[j, i]
+            b = 2.0 * a
+
+
+@dace.program
+def scale_rectangular(A: dace.float64[M, N], B: dace.float64[M, N]):
+    for i, j in dace.map[0:N, 0:M]:
+        with dace.tasklet:
+            a << A[j, i]
+            b >> B[j, i]
+            b = 2.0 * a
+
+
+@dace.program
+def gpu_kernel(
+    A: dace.float64[N] @ dace.dtypes.StorageType.GPU_Global,
+    B: dace.float64[N] @ dace.dtypes.StorageType.GPU_Global,
+    C: dace.float64[N] @ dace.dtypes.StorageType.GPU_Global,
+):
+    for i in dace.map[0:N:256] @ dace.dtypes.ScheduleType.GPU_Device:
+        for j in dace.map[0:256] @ dace.dtypes.ScheduleType.GPU_ThreadBlock:
+            C[i + j] = A[i + j] + B[i + j]
+
+
+@dataclass(eq=False)
+class _PeakAfterPermute(ppl.Pass):
+    # Reads the footprint analysis after PermuteArrayDimensions, which the pipeline has to re-run in between
+
+    def depends_on(self):
+        return {MemoryFootprintAnalysis, PermuteArrayDimensions}
+
+    def modifies(self) -> ppl.Modifies:
+        return ppl.Modifies.Nothing
+
+    def should_reapply(self, modified: ppl.Modifies) -> bool:
+        return False
+
+    def apply_pass(self, sdfg, pipeline_results):
+        footprint = pipeline_results[MemoryFootprintAnalysis.__name__]
+        return footprint.peak(), len(footprint.live_bytes)
+
+
+def test_lifetimes():
+    sdfg = dace.SDFG("lifetimes")
+    sdfg.add_array("A", [N], dace.float64)
+    sdfg.add_transient("tmp", [N], dace.float64)
+    sdfg.add_transient("persistent", [16], dace.float32, lifetime=dace.dtypes.AllocationLifetime.Persistent)
+    first = sdfg.add_state("first")
+    second = sdfg.add_state_after(first, "second")
+    first.add_nedge(first.add_access("A"), first.add_access("tmp"), dace.Memlet("A[0:N]"))
+
+    # tmp is only allocated in the state using it, persistent transients are always live
+    footprint = memory_footprint(sdfg, {"N": 100})
+    assert footprint.state_bytes(first) == 100 * 8 + 16 * 4
+    assert footprint.state_bytes(second) == 16 * 4
+    assert footprint.live_arrays[first] == {"tmp", "persistent"}
+    assert footprint.peak_state() is first
+    assert footprint.peak(dace.dtypes.StorageType.Default) == 100 * 8 + 16 * 4
+
+    with pytest.raises(ValueError):
+        memory_footprint(sdfg, {})
+
+
+def test_footprint_before_after():
+    sdfg = scale.to_sdfg(simplify=True)
+    permute = PermuteArrayDimensions(permute_map={"A": [1, 0], "B": [1, 0]}, add_permute_maps=True)
+    before, after = footprint_before_after(sdfg, permute, {"N": 16})
+
+    # The permuted copies are used in several states, so they are live for the whole SDFG
+    assert before.peak() == 0
+    assert after.peak() == 2 * 16 * 16 * 8
+    assert set(after.by_label()) >= {"permute_in", "permute_out"}
+    assert all(size == 2 * 16 * 16 * 8 for size in after.by_label().values())
+    assert after.live_arrays[after.peak_state()] == {"permuted_A", "permuted_B"}
+    assert "permuted_A" not in sdfg.arrays
+
+
+def test_pipeline_reruns_analysis():
+    sdfg = scale.to_sdfg(simplify=True)
+    pipeline = ppl.Pipeline([
+        MemoryFootprintAnalysis({"N": 16}),
+        PermuteArrayDimensions(permute_map={"A": [1, 0], "B": [1, 0]}, add_permute_maps=True),
+        _PeakAfterPermute(),
+    ])
+    results = pipeline.apply_pass(sdfg, {})
+    # Permuted copies of A and B, live in the permute_in, compute and permute_out states
+    assert results["_PeakAfterPermute"] == (2 * 16 * 16 * 8, 3)
+
+
+def test_permute_budget():
+    symbols = {"N": 16}
+    permute_map = {"A": [1, 0], "B": [1, 0]}
+
+    sdfg = scale.to_sdfg(simplify=True)
+    result = PermuteArrayDimensions(permute_map=permute_map, add_permute_maps=True, memory_budget=1 << 20,
+                                    budget_symbols=symbols).apply_pass(sdfg, {})
+    assert result.arrays_changed == ["A", "B"]
+    assert "permuted_A" in sdfg.arrays
+
+    sdfg = scale.to_sdfg(simplify=True)
+    with pytest.warns(UserWarning):
+        result = PermuteArrayDimensions(permute_map=permute_map, add_permute_maps=True, memory_budget=1024,
+                                        budget_symbols=symbols).apply_pass(sdfg, {})
+    assert result is None
+    assert "permuted_A" not in sdfg.arrays
+
+
+def test_permute_budget_results():
+    dace.Config.set('cache', value='unique')
+    symbols = {"M": 6, "N": 10}
+    original_sdfg = scale_rectangular.to_sdfg(simplify=True)
+    A = np.random.rand(6, 10)
+    B_orig = np.zeros_like(A)
+    original_sdfg(A=A.copy(), B=B_orig, **symbols)
+
+    # Permuted copies of A and B take 2 * 6 * 10 * 8 = 960 bytes. Both outcomes keep the layout of the arguments.
+    for budget, applied in ((1024, True), (512, False)):
+        sdfg = copy.deepcopy(original_sdfg)
+        sdfg.name = f"{original_sdfg.name}_budget_{budget}"
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = PermuteArrayDimensions(permute_map={"A": [1, 0], "B": [1, 0]}, add_permute_maps=True,
+                                            memory_budget=budget, budget_symbols=symbols).apply_pass(sdfg, {})
+        assert (result is not None) == applied
+        assert ("permuted_A" in sdfg.arrays) == applied
+        assert sdfg.arrays["A"].shape == original_sdfg.arrays["A"].shape
+        sdfg.validate()
+
+        B_trans = np.zeros_like(A)
+        sdfg(A=A.copy(), B=B_trans, **symbols)
+        assert np.allclose(B_orig, B_trans)
+
+
+def test_double_buffering_budget():
+    from layout_and_schedule_transformations.double_buffering import DoubleBuffering
+
+    sdfg = gpu_kernel.to_sdfg(simplify=True)
+    _add_shared_memory(sdfg, add_src_access_node=True)
+    [device_map] = [n for n, _ in sdfg.all_nodes_recursive()
+                    if isinstance(n, dace.nodes.MapEntry) and n.map.schedule == dace.dtypes.ScheduleType.GPU_Device]
+    shared_bytes = sum(dace.symbolic.evaluate(desc.total_size, {}) * desc.dtype.bytes
+                       for name, desc in sdfg.arrays.items() if name.startswith("shr_"))
+    options = {
+        "device_map_type": dace.dtypes.ScheduleType.GPU_Device,
+        "copy_src_type": dace.dtypes.StorageType.GPU_Global,
+        "copy_dst_type": dace.dtypes.StorageType.GPU_Shared,
+    }
+
+    # Doubling the staged buffers needs twice their size
+    for budget, applicable in ((2 * shared_bytes, True), (2 * shared_bytes - 1, False)):
+        budget_options = dict(options, memory_budget=int(budget))
+        assert DoubleBuffering(**budget_options).can_be_applied_to(sdfg=sdfg, options=budget_options,
+                                                                   map_entry=device_map) is applicable
+
+
+if __name__ == "__main__":
+    test_lifetimes()
+    test_footprint_before_after()
+    test_pipeline_reruns_analysis()
+    test_permute_budget()
+    test_permute_budget_results()
+    test_double_buffering_budget()
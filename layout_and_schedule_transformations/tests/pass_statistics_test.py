@@ -0,0 +1,81 @@
+import json
+import dace
+from dace.transformation import pass_pipeline as ppl
+
+from layout_and_schedule_transformations.pass_statistics import TransformationStatistics
+from layout_and_schedule_transformations.permute_array_dimensions import PermuteArrayDimensions
+from layout_and_schedule_transformations.permute_map_dimensions import PermuteMapDimensions
+
+N = dace.symbol("N", dtype=dace.int64)
+
+
+@dace.program
+def scale(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        with dace.tasklet:
+            a << A[j, i]
+            b >> B[j, i]
+            b = 2.0 * a
+
+
+def test_statistics_in_pipeline_results():
+    sdfg = scale.to_sdfg(simplify=True)
+    [map_entry] = [n for n, _ in sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]
+    label = map_entry.map.label
+
+    pipeline = ppl.Pipeline([
+        PermuteArrayDimensions(permute_map={"A": [1, 0], "B": [1, 0]}, add_permute_maps=True),
+        PermuteMapDimensions(permute_map={label: [1, 0]}, use_labels=True),
+    ])
+    results = pipeline.apply_pass(sdfg, {})
+    sdfg.validate()
+
+    array_statistics = results["PermuteArrayDimensions"]
+    assert isinstance(array_statistics, TransformationStatistics)
+    assert array_statistics.arrays_changed == ["A", "B"]
+    assert array_statistics.copy_states_added == 2
+    # Each array is copied in and out
+    assert dace.symbolic.evaluate(array_statistics.copy_bytes_added, {"N": 8}) == 4 * 8 * 8 * 8
+    # Access node -> map entry -> tasklet -> map exit -> access node in the compute state
+    assert array_statistics.memlets_rewritten == 4
+    assert array_statistics.nested_sdfgs_visited == 0
+    assert set(array_statistics.phase_times) == {"descriptors", "copies", "nested_sdfgs", "memlets"}
+    assert array_statistics.total_time > 0
+
+    map_statistics = results["PermuteMapDimensions"]
+    assert map_statistics.maps_changed == [label]
+    assert map_entry.map.params == ["j", "i"]
+
+    # The dictionary form is what dashboards store
+    dumped = json.loads(json.dumps(array_statistics.to_dict()))
+    assert dumped["copy_bytes_added"] == "32*N**2"
+
+
+def test_statistics_are_per_application():
+    permute = PermuteArrayDimensions(permute_map={"A": [1, 0]}, add_permute_maps=False)
+    pipeline_results = dict()
+    first = permute.apply_pass(scale.to_sdfg(simplify=True), pipeline_results)
+    second = permute.apply_pass(scale.to_sdfg(simplify=True), pipeline_results)
+    assert first is not second
+    assert first.arrays_changed == second.arrays_changed == ["A"]
+    assert second.copy_states_added == 0 and second.copy_bytes_added == 0
+    # Storing the results is up to the pipeline
+    assert pipeline_results == {}
+
+
+def test_map_permutation_without_labels():
+    # Without use_labels, maps can be given by their entry node or by their label
+    for by_node in (True, False):
+        sdfg = scale.to_sdfg(simplify=True)
+        [map_entry] = [n for n, _ in sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]
+        key = map_entry if by_node else map_entry.map.label
+        statistics = PermuteMapDimensions(permute_map={key: [1, 0]}, use_labels=False).apply_pass(sdfg, {})
+        sdfg.validate()
+        assert statistics.maps_changed == [map_entry.map.label]
+        assert map_entry.map.params == ["j", "i"]
+
+
+if __name__ == "__main__":
+    test_statistics_in_pipeline_results()
+    test_statistics_are_per_application()
+    test_map_permutation_without_labels()
@@ -111,6 +111,171 @@ def test_standalone_execution():
     return vals_A_close and vals_B_close
 
 
+def test_first_touch():
+    dace.Config.set('cache', value='unique')
+    N_val = 12
+    N = dace.symbol("N", dtype=dace.int64)
+
+    @dace.program
+    def transpose_kernel(A: dace.float64[N, N], B: dace.float64[N, N]):
+        for i, j in dace.map[0:N, 0:N]:
+            with dace.tasklet:
+                a << A[j, i]
+                b >> B[i, j]
+                b = 2.0 * a
+
+    original_sdfg = transpose_kernel.to_sdfg(simplify=True)
+    [consumer] = [n for n, _ in original_sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]
+    consumer.map.schedule = dace.dtypes.ScheduleType.CPU_Multicore
+    consumer.map.omp_schedule = dace.dtypes.OMPScheduleType.Static
+    consumer.map.omp_chunk_size = 2
+
+    transformed_sdfg = copy.deepcopy(original_sdfg)
+    transformed_sdfg.name = original_sdfg.name + "_first_touch"
+    PermuteArrayDimensions(permute_map={"A": [1, 0]}, add_permute_maps=True,
+                           first_touch=True).apply_pass(sdfg=transformed_sdfg, pipeline_results={})
+    transformed_sdfg.validate()
+
+    # The consumer partitions permuted_A[i, j] along dimension 0, which the copy-in map writes with i1
+    permute_in = [s for s in transformed_sdfg.states() if s.label == "permute_in"][0]
+    # The consumer iterates over the whole array, there is no halo to copy separately
+    [copy_in] = [n for n in permute_in.nodes() if isinstance(n, dace.nodes.MapEntry)]
+    assert copy_in.map.params == ["i1", "i0"]
+    assert copy_in.map.schedule == dace.dtypes.ScheduleType.CPU_Multicore
+    assert copy_in.map.omp_schedule == dace.dtypes.OMPScheduleType.Static
+    assert copy_in.map.omp_chunk_size == 2
+
+    A = np.random.rand(N_val, N_val)
+    B_orig = np.zeros_like(A)
+    B_trans = np.zeros_like(A)
+    original_sdfg(A=A.copy(), B=B_orig, N=N_val)
+    transformed_sdfg(A=A.copy(), B=B_trans, N=N_val)
+    assert np.allclose(B_orig, B_trans)
+    assert np.allclose(B_trans, 2.0 * A.T)
+
+
+def test_first_touch_halo():
+    dace.Config.set('cache', value='unique')
+    N_val = 12
+    N = dace.symbol("N", dtype=dace.int64)
+
+    @dace.program
+    def stencil_kernel(A: dace.float64[N, N], B: dace.float64[N, N]):
+        for i, j in dace.map[1:N - 1, 0:N]:
+            with dace.tasklet:
+                center << A[j, i]
+                left << A[j, i - 1]
+                right << A[j, i + 1]
+                b >> B[i, j]
+                b = 0.5 * center + 0.25 * (left + right)
+
+    original_sdfg = stencil_kernel.to_sdfg(simplify=True)
+    [consumer] = [n for n, _ in original_sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]
+    consumer.map.schedule = dace.dtypes.ScheduleType.CPU_Multicore
+    consumer.map.omp_schedule = dace.dtypes.OMPScheduleType.Static
+
+    transformed_sdfg = copy.deepcopy(original_sdfg)
+    transformed_sdfg.name = original_sdfg.name + "_first_touch_halo"
+    PermuteArrayDimensions(permute_map={"A": [1, 0]}, add_permute_maps=True,
+                           first_touch=True).apply_pass(sdfg=transformed_sdfg, pipeline_results={})
+    transformed_sdfg.validate()
+
+    # The partitioned copy iterates over the rows the consumer iterates over, the halo rows are copied separately
+    permute_in = [s for s in transformed_sdfg.states() if s.label == "permute_in"][0]
+    copy_maps = [n for n in permute_in.nodes() if isinstance(n, dace.nodes.MapEntry)]
+    [copy_in] = [n for n in copy_maps if n.map.schedule == dace.dtypes.ScheduleType.CPU_Multicore]
+    assert copy_in.map.params[0] == "i1"
+    assert copy_in.map.range[0] == (1, N - 2, 1)
+    assert len(copy_maps) == 3
+
+    A = np.random.rand(N_val, N_val)
+    B_orig = np.zeros_like(A)
+    B_trans = np.zeros_like(A)
+    original_sdfg(A=A.copy(), B=B_orig, N=N_val)
+    transformed_sdfg(A=A.copy(), B=B_trans, N=N_val)
+    assert np.allclose(B_orig, B_trans)
+
+
+def test_first_touch_after_map_permutation():
+    dace.Config.set('cache', value='unique')
+    N_val = 12
+    N = dace.symbol("N", dtype=dace.int64)
+
+    @dace.program
+    def transpose_kernel(A: dace.float64[N, N], B: dace.float64[N, N]):
+        for i, j in dace.map[0:N, 0:N]:
+            with dace.tasklet:
+                a << A[j, i]
+                b >> B[i, j]
+                b = 2.0 * a
+
+    original_sdfg = transpose_kernel.to_sdfg(simplify=True)
+    [consumer] = [n for n, _ in original_sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]
+    consumer.map.schedule = dace.dtypes.ScheduleType.CPU_Multicore
+    consumer.map.omp_schedule = dace.dtypes.OMPScheduleType.Static
+
+    # First touch partitions the copy-in like the consumer, so the maps have to be permuted before the arrays
+    transformed_sdfg = copy.deepcopy(original_sdfg)
+    transformed_sdfg.name = original_sdfg.name + "_first_touch_permuted_map"
+    PermuteMapDimensions(permute_map={consumer.map.label: [1, 0]},
+                         use_labels=True).apply_pass(sdfg=transformed_sdfg, pipeline_results={})
+    PermuteArrayDimensions(permute_map={"A": [1, 0]}, add_permute_maps=True,
+                           first_touch=True).apply_pass(sdfg=transformed_sdfg, pipeline_results={})
+    transformed_sdfg.validate()
+
+    # The permuted consumer partitions permuted_A[i, j] along dimension 1, which the copy-in map writes with i0
+    permute_in = [s for s in transformed_sdfg.states() if s.label == "permute_in"][0]
+    [copy_in] = [n for n in permute_in.nodes() if isinstance(n, dace.nodes.MapEntry)]
+    assert copy_in.map.params == ["i0", "i1"]
+    assert copy_in.map.schedule == dace.dtypes.ScheduleType.CPU_Multicore
+
+    A = np.random.rand(N_val, N_val)
+    B_trans = np.zeros_like(A)
+    transformed_sdfg(A=A.copy(), B=B_trans, N=N_val)
+    assert np.allclose(B_trans, 2.0 * A.T)
+
+
+def test_streaming_permute():
+    dace.Config.set('cache', value='unique')
+    N = dace.symbol("N", dtype=dace.int64)
+    M = dace.symbol("M", dtype=dace.int64)
+
+    @dace.program
+    def add_kernel(A: dace.float64[N, M], B: dace.float64[N, M]):
+        for i, j in dace.map[0:N, 0:M]:
+            with dace.tasklet:
+                a << A[i, j]
+                b >> B[i, j]
+                b = a + 1.0
+
+    original_sdfg = add_kernel.to_sdfg(simplify=True)
+    A = np.random.rand(7, 5)
+    B_orig = np.zeros_like(A)
+    original_sdfg(A=A.copy(), B=B_orig, N=7, M=5)
+
+    # Slab sizes that do not divide the non-square extents
+    for slab_size, slab_dim in ((None, 0), (3, 0), (3, 1)):
+        transformed_sdfg = copy.deepcopy(original_sdfg)
+        transformed_sdfg.name = f"{original_sdfg.name}_slabs_{slab_size}_{slab_dim}"
+        PermuteArrayDimensions(permute_map={"A": [1, 0], "B": [1, 0]}, add_permute_maps=True, slab_size=slab_size,
+                               slab_dim=slab_dim).apply_pass(sdfg=transformed_sdfg, pipeline_results={})
+        transformed_sdfg.validate()
+
+        loops = [n for n in transformed_sdfg.nodes() if isinstance(n, dace.sdfg.state.LoopRegion)]
+        assert len(loops) == (0 if slab_size is None else 4)
+        for loop in loops:
+            [slab_map] = [n for s in loop.all_states() for n in s.nodes() if isinstance(n, dace.nodes.MapEntry)]
+            assert loop.loop_variable in {str(s) for s in slab_map.map.range.free_symbols}
+
+        B_trans = np.zeros_like(A)
+        transformed_sdfg(A=A.copy(), B=B_trans, N=7, M=5)
+        assert np.allclose(B_orig, B_trans)
+
+
 if __name__ == "__main__":
+    test_first_touch()
+    test_first_touch_halo()
+    test_first_touch_after_map_permutation()
+    test_streaming_permute()
     success = test_standalone_execution()
     exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,105 @@
+import copy
+import subprocess
+import sys
+import numpy as np
+import dace
+import pytest
+
+import layout_and_schedule_transformations
+from layout_and_schedule_transformations.permute_array_dimensions import PermuteArrayDimensions
+from layout_and_schedule_transformations.plan import TransformationPlan, dispatch
+
+N = dace.symbol("N", dtype=dace.int64)
+
+
+@dace.program
+def scale(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        with dace.tasklet:
+            a << A[j, i]
+            b >> B[j, i]
+            b = 2.0 * a
+
+
+def _plan(map_label: str) -> TransformationPlan:
+    return TransformationPlan.from_list([
+        {"transformation": "PermuteArrayDimensions",
+         "options": {"permute_map": {"A": [1, 0], "B": [1, 0]}, "add_permute_maps": True}},
+        {"transformation": "PermuteMapDimensions", "options": {"permute_map": {map_label: [1, 0]}, "use_labels": True}},
+    ])
+
+
+def test_no_dace_import():
+    # Importing the package, parsing and validating a plan must not import dace
+    code = "\n".join([
+        "import sys",
+        "import layout_and_schedule_transformations as lst",
+        "from layout_and_schedule_transformations.plan import TransformationPlan",
+        "plan = TransformationPlan.from_json('[{\"transformation\": \"EmptyTransformation\"}]')",
+        "plan.validate()",
+        "assert sorted(dir(lst)) and 'DoubleBuffering' in lst.__all__",
+        "assert 'dace' not in sys.modules, 'dace was imported'",
+        "lst.PermuteArrayDimensions",
+        "assert 'dace' in sys.modules",
+    ])
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes():
+    assert layout_and_schedule_transformations.PermuteArrayDimensions is PermuteArrayDimensions
+    with pytest.raises(AttributeError):
+        layout_and_schedule_transformations.NoSuchTransformation
+
+
+def test_validation():
+    _plan("some_map").validate()
+    TransformationPlan.from_list([{"transformation": "DoubleBuffering",
+                                   "options": {"device_map_type": "GPU_Device"}}]).validate()
+
+    for steps in ([{"transformation": "NoSuchTransformation"}],
+                  [{"transformation": "PermuteArrayDimensions", "options": {"permute_map": {"A": [1, 0]}}}],
+                  [{"transformation": "PermuteArrayDimensions",
+                    "options": {"permute_map": {"A": [1, 1]}, "add_permute_maps": True}}],
+                  [{"transformation": "PermuteMapDimensions",
+                    "options": {"permute_map": {"m": [1, 0]}, "use_labels": False}}],
+                  [{"transformation": "EmptyTransformation", "options": {"tile_size": 4}}]):
+        with pytest.raises(ValueError):
+            TransformationPlan.from_list(steps).validate()
+
+
+def test_apply_and_dispatch(tmp_path):
+    dace.Config.set('cache', value='unique')
+    original_sdfg = scale.to_sdfg(simplify=True)
+    [map_entry] = [n for n, _ in original_sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]
+    plan = TransformationPlan.from_json(_plan(map_entry.map.label).to_json())
+
+    transformed_sdfg = copy.deepcopy(original_sdfg)
+    transformed_sdfg.name = original_sdfg.name + "_planned"
+    results = plan.apply(transformed_sdfg)
+    assert set(results) == {"PermuteArrayDimensions", "PermuteMapDimensions"}
+    assert transformed_sdfg.arrays["permuted_A"].shape == (N, N)
+
+    # Workers get the plan in its JSON form and the SDFGs as files
+    input_path = str(tmp_path / "input.sdfg")
+    output_path = str(tmp_path / "output.sdfg")
+    original_sdfg.save(input_path)
+    assert dispatch(plan.to_json(), [(input_path, output_path)], max_workers=1) == [output_path]
+    dispatched_sdfg = dace.SDFG.from_file(output_path)
+    dispatched_sdfg.name = original_sdfg.name + "_dispatched"
+    assert "permuted_B" in dispatched_sdfg.arrays
+
+    A = np.random.rand(8, 8)
+    for sdfg in (transformed_sdfg, dispatched_sdfg):
+        B = np.zeros_like(A)
+        sdfg(A=A.copy(), B=B, N=8)
+        assert np.allclose(B, 2.0 * A)
+
+
+if __name__ == "__main__":
+    import tempfile
+    import pathlib
+    test_no_dace_import()
+    test_lazy_attributes()
+    test_validation()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_apply_and_dispatch(pathlib.Path(tmp_dir))
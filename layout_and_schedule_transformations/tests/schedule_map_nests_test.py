@@ -0,0 +1,100 @@
+import copy
+import numpy as np
+import dace
+import pytest
+
+from layout_and_schedule_transformations.schedule_map_nests import MapSchedule, ScheduleMapNests
+
+N = dace.symbol("N", dtype=dace.int64)
+
+
+@dace.program
+def scale(A: dace.float64[N, N, N], B: dace.float64[N, N, N]):
+    for i, j, k in dace.map[0:N, 0:N, 0:N]:
+        with dace.tasklet:
+            a << A[i, k, j]
+            b >> B[i, k, j]
+            b = 2.0 * a
+
+
+@dace.program
+def nested_scale(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i in dace.map[0:N]:
+        for j in dace.map[0:N]:
+            with dace.tasklet:
+                a << A[j, i]
+                b >> B[j, i]
+                b = 2.0 * a
+
+
+def _map_entries(sdfg: dace.SDFG):
+    return [n for n, _ in sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]
+
+
+def test_parse_schedule():
+    schedule = MapSchedule.from_string("permute [0, 2, 1], tile k by 32, strip-mine i by 8, parallelize outer")
+    assert schedule == MapSchedule(permute=[0, 2, 1], tile={"k": 32}, strip_mine={"i": 8}, parallelize="outer")
+    assert MapSchedule.from_string("collapse").collapse
+
+    with pytest.raises(ValueError):
+        MapSchedule.from_string("unroll k by 4")
+
+
+def test_permute_tile_parallelize():
+    dace.Config.set('cache', value='unique')
+    N_val = 10  # Not a multiple of the tile size
+
+    original_sdfg = scale.to_sdfg(simplify=True)
+    transformed_sdfg = copy.deepcopy(original_sdfg)
+    transformed_sdfg.name = original_sdfg.name + "_scheduled"
+    [map_entry] = _map_entries(transformed_sdfg)
+
+    ScheduleMapNests({map_entry.map.label: "permute [0,2,1], tile k by 4, parallelize outer"}).apply_pass(
+        transformed_sdfg, {})
+    transformed_sdfg.validate()
+
+    outer, inner = sorted(_map_entries(transformed_sdfg), key=lambda e: len(e.map.params))
+    assert outer.map.params == ["tile_k"]
+    assert inner.map.params == ["i", "k", "j"]
+    assert outer.map.schedule == dace.dtypes.ScheduleType.CPU_Multicore
+    assert inner.map.schedule == dace.dtypes.ScheduleType.Sequential
+
+    A = np.random.rand(N_val, N_val, N_val)
+    B_orig = np.zeros_like(A)
+    B_trans = np.zeros_like(A)
+    original_sdfg(A=A, B=B_orig, N=N_val)
+    transformed_sdfg(A=A.copy(), B=B_trans, N=N_val)
+    assert np.allclose(B_orig, B_trans)
+
+
+def test_collapse_and_permute():
+    sdfg = nested_scale.to_sdfg(simplify=True)
+    outer_label = [e.map.label for e in _map_entries(sdfg) if e.map.params == ["i"]][0]
+
+    ScheduleMapNests({outer_label: MapSchedule(collapse=True, permute=[1, 0])}).apply_pass(sdfg, {})
+    sdfg.validate()
+    [map_entry] = _map_entries(sdfg)
+    assert map_entry.map.params == ["j", "i"]
+
+
+def test_illegal_schedules_do_not_modify():
+    sdfg = scale.to_sdfg(simplify=True)
+    [map_entry] = _map_entries(sdfg)
+    label = map_entry.map.label
+
+    for spec in ("permute [0, 1]", "tile x by 4", "tile k by 0", "tile k by 4, strip-mine k by 4", "collapse",
+                 "parallelize everything"):
+        with pytest.raises(ValueError):
+            ScheduleMapNests({label: spec}).apply_pass(sdfg, {})
+    with pytest.raises(ValueError):
+        ScheduleMapNests({"no_such_map": "permute [0, 1, 2]"}).apply_pass(sdfg, {})
+
+    assert _map_entries(sdfg) == [map_entry]
+    assert map_entry.map.params == ["i", "j", "k"]
+
+
+if __name__ == "__main__":
+    test_parse_schedule()
+    test_permute_tile_parallelize()
+    test_collapse_and_permute()
+    test_illegal_schedules_do_not_modify()